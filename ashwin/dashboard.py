@@ -4,23 +4,71 @@ Enhanced Flask Dashboard for Auto Class Joiner Monitoring
 Provides real-time logs, screenshots, meeting status, and mobile-responsive control interface
 """
 
-from flask import Flask, render_template, render_template_string, jsonify, send_from_directory, request, Response
+from flask import Flask, render_template, jsonify, send_from_directory, request, Response, g
+import functools
+import gzip
+import heapq
+import hashlib
 import os
 import json
-import glob
+import collections
+import mmap
 import datetime
 from pathlib import Path
+import queue
+import re
+import socket
 import threading
 import time
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 app = Flask(__name__)
 
+# Use orjson for response serialization when available - /api/logs can carry
+# hundreds of lines and the C encoder is several times faster than stdlib json
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+    def _sse_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _sse_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Gzip API responses - a 1000-line log payload compresses ~10x
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    pass
+
+# When a reverse proxy that understands X-Sendfile sits in front of the
+# dashboard, let it serve screenshot bytes via kernel sendfile
+app.config['USE_X_SENDFILE'] = os.environ.get('DASHBOARD_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
 # Configuration - Fixed path issues
 LOGS_DIR = "/app/logs_ashwin"
 SCREENSHOTS_DIR = "/app/screenshots_ashwin"
 LOG_FILE = os.path.join(LOGS_DIR, "class_joiner.log")
 STATUS_FILE = os.path.join(LOGS_DIR, "app_status.json")
 SCREENSHOT_TRIGGER_FILE = os.path.join(LOGS_DIR, "take_screenshot")
+SCREENSHOT_TRIGGER_SOCKET = os.path.join(LOGS_DIR, ".screenshot_trigger.sock")
 
 # Ensure directories exist
 os.makedirs(LOGS_DIR, exist_ok=True)
@@ -31,6 +79,68 @@ class LogMonitor:
         self.latest_logs = []
         self.max_logs = 1000  # Increased to show more logs
         self.last_position = 0
+        self._fd = None
+        self._mmap = None
+        self._mmap_size = 0
+        # Rolling window kept warm by the tailer thread so /api/logs can be
+        # answered from memory instead of re-reading the file
+        self.ring = collections.deque(maxlen=self.max_logs)
+        self._ring_lock = threading.Lock()
+        # The tailer thread is the usual caller, but the cursor must stay
+        # consistent if anything else ever reads incrementally too
+        self._position_lock = threading.Lock()
+
+    def append_to_ring(self, lines):
+        """Record freshly tailed lines in the in-memory ring"""
+        with self._ring_lock:
+            self.ring.extend(lines)
+
+    def _drop_ring(self):
+        """Forget the warm window after rotation/truncation - the lines it
+        holds no longer exist in the file and must not be served"""
+        with self._ring_lock:
+            self.ring.clear()
+
+    def ring_tail(self, lines):
+        """Serve the last `lines` entries from the ring, or None if too cold"""
+        with self._ring_lock:
+            if len(self.ring) >= lines or len(self.ring) >= self.max_logs:
+                return list(self.ring)[-lines:]
+        return None
+
+    def _get_fd(self):
+        """Lazily open and cache a read-only fd for positioned reads"""
+        if self._fd is None:
+            self._fd = os.open(LOG_FILE, os.O_RDONLY)
+        return self._fd
+
+    def _close_fd(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except (OSError, ValueError):
+                pass
+            self._mmap = None
+            self._mmap_size = 0
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _get_mmap(self):
+        """Memory-map the log file, remapping when it grows or is truncated"""
+        fd = self._get_fd()
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return None
+        if self._mmap is None or size != self._mmap_size:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+            self._mmap_size = size
+        return self._mmap
 
     def get_all_logs(self):
         """Get ALL log entries from the file"""
@@ -38,39 +148,117 @@ class LogMonitor:
             if not os.path.exists(LOG_FILE):
                 return []
 
-            with open(LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                return [line.strip() for line in all_lines if line.strip()]
+            # Iterate instead of readlines() so peak memory stays at one
+            # line rather than the whole file; a binary read with a 64 KiB
+            # buffer keeps syscall count down on multi-MB logs
+            result = []
+            with open(LOG_FILE, 'rb', buffering=1 << 16) as f:
+                for line in f:
+                    stripped = line.decode('utf-8', errors='ignore').strip()
+                    if stripped:
+                        result.append(stripped)
+            return result
         except Exception as e:
             return [f"Error reading logs: {str(e)}"]
 
     def get_latest_logs(self, lines=100):
-        """Get the latest log entries"""
+        """Get the latest log entries without reading the whole file"""
         try:
-            if not os.path.exists(LOG_FILE):
+            cached = self.ring_tail(lines)
+            if cached is not None:
+                return cached
+
+            try:
+                view = self._get_mmap()
+            except (OSError, ValueError):
+                self._close_fd()
+                return []
+
+            if view is None:
                 return []
 
-            with open(LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                return [line.strip() for line in all_lines[-lines:] if line.strip()]
+            # Walk backwards over the mapping with rfind (a C-level scan)
+            # until enough newlines are found - no read syscalls at all
+            end = len(view)
+            pos = end
+            count = 0
+            while count <= lines and pos > 0:
+                newline = view.rfind(b'\n', 0, pos)
+                if newline == -1:
+                    pos = 0
+                    break
+                count += 1
+                pos = newline
+
+            # splitlines on bytes drops separators and handles \r\n; filter
+            # blanks once, then decode only the lines we actually return
+            raw_lines = [b for b in view[pos:end].splitlines() if b.strip()]
+            return [b.decode('utf-8', errors='replace').strip() for b in raw_lines[-lines:]]
         except Exception as e:
             return [f"Error reading logs: {str(e)}"]
 
-    def get_new_logs_since_position(self):
-        """Get new log entries since last check"""
-        try:
-            if not os.path.exists(LOG_FILE):
-                return [], 0
-
-            with open(LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                f.seek(self.last_position)
-                new_content = f.read()
-                self.last_position = f.tell()
+    def read_from_offset(self, offset):
+        """Read lines appended after a byte offset (client polling cursor)
 
-                if new_content:
-                    new_lines = [line.strip() for line in new_content.split('\n') if line.strip()]
-                    return new_lines, self.last_position
+        Unlike get_new_logs_since_position this is stateless: the caller
+        owns the cursor, so any number of polling clients can use it
+        without racing on the shared tail position.
+        """
+        try:
+            with open(LOG_FILE, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                # Cursor past EOF means the log was rotated or truncated
+                if offset < 0 or offset > size:
+                    offset = 0
+                if offset == size:
+                    return [], size
+                f.seek(offset)
+                decoded = f.read(size - offset).decode('utf-8', errors='ignore')
+            return [line.strip() for line in decoded.split('\n') if line.strip()], size
+        except FileNotFoundError:
+            return [], 0
+        except Exception as e:
+            return [f"Error reading logs: {str(e)}"], offset
 
+    def get_new_logs_since_position(self):
+        """Get new log entries since last check using pread on a cached fd"""
+        try:
+            with self._position_lock:
+                fd = self._get_fd()
+                fd_stat = os.fstat(fd)
+                size = fd_stat.st_size
+
+                # Rotation by rename leaves the cached fd on the old inode
+                try:
+                    if os.stat(LOG_FILE).st_ino != fd_stat.st_ino:
+                        self._close_fd()
+                        fd = self._get_fd()
+                        size = os.fstat(fd).st_size
+                        self.last_position = 0
+                        self._drop_ring()
+                except FileNotFoundError:
+                    pass
+
+                # Log was rotated or truncated - reopen and start over
+                if size < self.last_position:
+                    self._close_fd()
+                    fd = self._get_fd()
+                    size = os.fstat(fd).st_size
+                    self.last_position = 0
+                    self._drop_ring()
+
+                if size > self.last_position:
+                    new_content = os.pread(fd, size - self.last_position, self.last_position)
+                    self.last_position = size
+
+                    if new_content:
+                        decoded = new_content.decode('utf-8', errors='ignore')
+                        new_lines = [line.strip() for line in decoded.split('\n') if line.strip()]
+                        return new_lines, self.last_position
+
+        except FileNotFoundError:
+            self._close_fd()
+            return [], self.last_position
         except Exception as e:
             return [f"Error reading new logs: {str(e)}"], self.last_position
 
@@ -78,12 +266,112 @@ class LogMonitor:
 
 log_monitor = LogMonitor()
 
+# Precompiled single-pass classifier so each line is scanned once on the
+# server instead of per-keyword in the browser
+_LOG_LEVEL_RE = re.compile(r'ERROR|WARNING|WARN|INFO')
+_LOG_LEVEL_MAP = {'ERROR': 'error', 'WARNING': 'warning', 'WARN': 'warning', 'INFO': 'info'}
+
+def classify_log_line(line):
+    """Classify a log line as error/warning/info in one regex pass"""
+    match = _LOG_LEVEL_RE.search(line)
+    return _LOG_LEVEL_MAP[match.group()] if match else None
+
+# Event-driven log change notification - the tailer blocks on this event
+# instead of polling the file every second. An Event stays set until the
+# tailer clears it, so a notification that fires while the tailer is busy
+# reading is picked up by the next wait instead of being lost (a bare
+# Condition.notify_all in that window would be dropped)
+log_changed = threading.Event()
+
+if WATCHDOG_AVAILABLE:
+    class LogFileEventHandler(FileSystemEventHandler):
+        """Wake up the log tailer when the log file is modified"""
+        def on_modified(self, event):
+            if not event.is_directory and event.src_path == LOG_FILE:
+                log_changed.set()
+
+    log_observer = Observer()
+    log_observer.schedule(LogFileEventHandler(), LOGS_DIR, recursive=False)
+    log_observer.daemon = True
+    log_observer.start()
+
+def wait_for_log_change(timeout=30):
+    """Block until the log file changes, or timeout as a safety valve;
+    falls back to 1-second polling when watchdog is unavailable"""
+    if WATCHDOG_AVAILABLE:
+        log_changed.wait(timeout=timeout)
+        log_changed.clear()
+    else:
+        time.sleep(1)
+
+class LogTailer(threading.Thread):
+    """Single reader thread that fans new log lines out to SSE subscribers
+
+    Only this thread touches the LogMonitor read position, so concurrent
+    SSE clients no longer race on it and disk reads stay O(1) regardless
+    of how many dashboards are open.
+    """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        client_queue = queue.SimpleQueue()
+        with self._lock:
+            self._subscribers.add(client_queue)
+        return client_queue
+
+    def unsubscribe(self, client_queue):
+        with self._lock:
+            self._subscribers.discard(client_queue)
+
+    def run(self):
+        while True:
+            try:
+                new_logs, _ = log_monitor.get_new_logs_since_position()
+                if new_logs:
+                    log_monitor.append_to_ring(new_logs)
+                    with self._lock:
+                        subscribers = list(self._subscribers)
+                    for log_line in new_logs:
+                        for client_queue in subscribers:
+                            client_queue.put(log_line)
+                wait_for_log_change()
+            except Exception as e:
+                print(f"Error in log tailer: {e}")
+                time.sleep(1)
+
+log_tailer = LogTailer()
+log_tailer.start()
+
+def _request_stat(path):
+    """Stat a path at most once per request (memoized on flask.g)"""
+    cache = getattr(g, '_stat_cache', None)
+    if cache is None:
+        cache = g._stat_cache = {}
+    if path not in cache:
+        try:
+            cache[path] = os.stat(path)
+        except OSError:
+            cache[path] = None
+    return cache[path]
+
+# app_status.json is rewritten by the joiner but polled far more often than
+# it changes; re-parse only when its mtime moves
+_status_file_cache = {'mtime': -1, 'data': None}
+
 def get_app_status():
     """Get current application status"""
     try:
-        if os.path.exists(STATUS_FILE):
+        stat = _request_stat(STATUS_FILE)
+        if stat is not None:
+            if stat.st_mtime == _status_file_cache['mtime']:
+                return _status_file_cache['data']
             with open(STATUS_FILE, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
+            _status_file_cache.update(mtime=stat.st_mtime, data=data)
+            return data
     except Exception as e:
         print(f"Error reading status file: {e}")
     
@@ -94,101 +382,257 @@ def get_app_status():
         "meeting_info": {}
     }
 
+# Cache for get_screenshots - screenshots change rarely but the endpoint is
+# hit by /api/screenshots and /api/status on every client poll
+_screenshots_cache = {'dir_mtimes': None, 'data': [], 'ts': 0, 'dirty': True}
+_SCREENSHOTS_CACHE_TTL = 2  # seconds
+
+if WATCHDOG_AVAILABLE:
+    class ScreenshotEventHandler(FileSystemEventHandler):
+        """Mark the in-memory screenshot index stale when an image changes"""
+        def on_any_event(self, event):
+            if not event.is_directory and event.src_path.endswith(('.png', '.webp')):
+                _screenshots_cache['dirty'] = True
+
+    _screenshot_observer = Observer()
+    for _watch_dir in (SCREENSHOTS_DIR, LOGS_DIR):
+        _screenshot_observer.schedule(ScreenshotEventHandler(), _watch_dir, recursive=True)
+    _screenshot_observer.daemon = True
+    _screenshot_observer.start()
+
+def _screenshot_dir_mtimes():
+    """Get mtimes of the screenshot directories to detect changes cheaply"""
+    mtimes = []
+    for directory in (SCREENSHOTS_DIR, LOGS_DIR, os.path.join(LOGS_DIR, "screenshots")):
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
 def get_screenshots():
-    """Get list of available screenshots"""
-    screenshot_patterns = [
-        os.path.join(SCREENSHOTS_DIR, "screenshot_*.png"),
-        os.path.join(LOGS_DIR, "screenshot_*.png"),
-        os.path.join(LOGS_DIR, "screenshots", "screenshot_*.png")
+    """Get list of available screenshots (served from memory until they change)"""
+    if WATCHDOG_AVAILABLE:
+        # The observer flips the dirty flag on png events, so an unchanged
+        # listing is a pure memory read - no glob, no stat
+        if not _screenshots_cache['dirty']:
+            return _screenshots_cache['data']
+        _screenshots_cache['dirty'] = False
+        data = _scan_screenshots()
+        _screenshots_cache['data'] = data
+        return data
+
+    # Polling fallback: TTL plus directory-mtime gate
+    now = time.monotonic()
+    if now - _screenshots_cache['ts'] < _SCREENSHOTS_CACHE_TTL:
+        return _screenshots_cache['data']
+
+    dir_mtimes = _screenshot_dir_mtimes()
+    if dir_mtimes == _screenshots_cache['dir_mtimes']:
+        _screenshots_cache['ts'] = now
+        return _screenshots_cache['data']
+
+    data = _scan_screenshots()
+    _screenshots_cache.update(dir_mtimes=dir_mtimes, data=data, ts=now)
+    return data
+
+def _scan_screenshots():
+    """Scan the filesystem for screenshots with a single scandir pass per directory"""
+    screenshot_dirs = [
+        SCREENSHOTS_DIR,
+        LOGS_DIR,
+        os.path.join(LOGS_DIR, "screenshots")
     ]
 
+    # DirEntry.stat() reuses metadata from the readdir batch, so this is one
+    # syscall per entry instead of separate glob + getmtime + stat calls
     screenshots = []
-    for pattern in screenshot_patterns:
-        screenshots.extend(glob.glob(pattern))
-
-    # Sort by modification time (newest first)
-    screenshots.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-
-    screenshot_data = []
-    for screenshot in screenshots[:20]:  # Increased to 20 most recent
+    for directory in screenshot_dirs:
         try:
-            stat = os.stat(screenshot)
-            screenshot_data.append({
-                'filename': os.path.basename(screenshot),
-                'path': screenshot,
-                'size': stat.st_size,
-                'modified': datetime.datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'modified_timestamp': stat.st_mtime
-            })
-        except Exception as e:
-            print(f"Error processing screenshot {screenshot}: {e}")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if (entry.name.startswith('screenshot_')
+                            and entry.name.endswith(('.png', '.webp'))
+                            and entry.is_file()):
+                        stat = entry.stat()
+                        screenshots.append((stat.st_mtime, entry.path, stat))
+        except OSError:
+            continue
+
+    # Top 20 newest; nlargest is O(N log 20) where a full sort is O(N log N)
+    newest = heapq.nlargest(20, screenshots, key=lambda item: item[0])
+
+    # Ship only the raw mtime; the browser formats it locally. This also
+    # keeps absolute server paths out of the payload.
+    screenshot_data = []
+    for _, path, stat in newest:
+        screenshot_data.append({
+            'filename': os.path.basename(path),
+            'size': stat.st_size,
+            'modified_timestamp': stat.st_mtime
+        })
 
     return screenshot_data
 
+# The dashboard page is static, so render, encode and compress it exactly once
+_html_cache = {}
+
+def _get_dashboard_html():
+    if not _html_cache:
+        html_bytes = render_template('dashboard.html').encode('utf-8')
+        _html_cache['plain'] = html_bytes
+        _html_cache['gzip'] = gzip.compress(html_bytes, 6)
+        _html_cache['etag'] = hashlib.md5(html_bytes).hexdigest()
+    return _html_cache
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
-    return render_template_string(ENHANCED_DASHBOARD_HTML)
+    cache = _get_dashboard_html()
+
+    if request.headers.get('If-None-Match') == cache['etag']:
+        return Response(status=304, headers={'ETag': cache['etag']})
+
+    headers = {'ETag': cache['etag']}
+    body = cache['plain']
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        body = cache['gzip']
+        headers['Content-Encoding'] = 'gzip'
+
+    return Response(body, mimetype='text/html', headers=headers)
 
 @app.route('/api/logs')
 def get_logs():
     """API endpoint to get logs"""
     lines = request.args.get('lines', 100, type=int)
     get_all = request.args.get('all', 'false').lower() == 'true'
-    
-    if get_all:
+    level = request.args.get('level')
+    after = request.args.get('after', type=int)
+
+    # ETag from the log file identity plus the query shape: if the file
+    # hasn't moved, skip the read and send an empty 304
+    etag = None
+    log_stat = _request_stat(LOG_FILE)
+    if log_stat is not None:
+        etag = f"{log_stat.st_mtime_ns:x}-{log_stat.st_size:x}-{lines}-{get_all:d}-{level or ''}-{after if after is not None else ''}"
+        if etag in request.if_none_match:
+            return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+    if after is not None:
+        # Cursor mode: return only bytes past the client's last offset, so
+        # quiet polls cost a stat and carry an empty list
+        logs, cursor = log_monitor.read_from_offset(after)
+    elif get_all:
         logs = log_monitor.get_all_logs()
+        cursor = log_stat.st_size if log_stat else 0
     else:
         logs = log_monitor.get_latest_logs(lines)
-    
-    return jsonify({'logs': logs, 'total': len(logs)})
+        cursor = log_stat.st_size if log_stat else 0
+
+    # Classify once on the server; every connected dashboard then renders
+    # straight from the level field instead of re-scanning each line
+    entries = [{'log': line, 'level': classify_log_line(line)} for line in logs]
+
+    # Optional server-side severity filter via the precompiled classifier
+    if level in ('error', 'warning', 'info'):
+        entries = [entry for entry in entries if entry['level'] == level]
+
+    response = jsonify({'logs': entries, 'total': len(entries), 'cursor': cursor})
+    if etag:
+        response.set_etag(etag)
+    return response
 
 @app.route('/api/logs/stream')
 def stream_logs():
     """Server-sent events for real-time log streaming"""
     def generate():
-        while True:
-            new_logs, _ = log_monitor.get_new_logs_since_position()
-            if new_logs:
-                for log_line in new_logs:
-                    yield f"data: {json.dumps({'log': log_line, 'timestamp': datetime.datetime.now().isoformat()})}\n\n"
-            time.sleep(1)
+        client_queue = log_tailer.subscribe()
+        try:
+            while True:
+                # Block for the first line, then drain whatever else arrived
+                # so a burst (e.g. a stack trace) goes out as one frame
+                try:
+                    first_line = client_queue.get(timeout=15)
+                except queue.Empty:
+                    # Keep-alive comment so proxies don't drop idle streams
+                    yield b": ping\n\n"
+                    continue
+
+                batch = [first_line]
+                batch_bytes = len(batch[0])
+                while len(batch) < 64 and batch_bytes < 8192:
+                    try:
+                        log_line = client_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(log_line)
+                    batch_bytes += len(log_line)
+
+                payload = {
+                    'logs': [{'log': line, 'level': classify_log_line(line)} for line in batch],
+                    'timestamp': datetime.datetime.now().isoformat()
+                }
+                yield b"data: " + _sse_dumps(payload) + b"\n\n"
+        finally:
+            log_tailer.unsubscribe(client_queue)
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+# /api/status is polled every 15s per client; cache the payload briefly so
+# extra clients don't multiply the stat calls
+_status_cache = {'ts': 0, 'payload': None}
+_status_cache_lock = threading.Lock()
+_STATUS_CACHE_TTL = 1  # seconds
+
+def _build_status():
+    """Build the /api/status payload with a single stat of the log file"""
+    app_status_data = get_app_status()
+
+    # One stat covers existence, last modification and liveness
+    log_stat = _request_stat(LOG_FILE)
+
+    log_exists = log_stat is not None
+    last_log_time = None
+    app_running = False
+    if log_stat:
+        last_log_time = datetime.datetime.fromtimestamp(log_stat.st_mtime).isoformat()
+        # Main application is considered running on recent log activity
+        app_running = (time.time() - log_stat.st_mtime) < 300  # 5 minutes
+
+    # Get recent screenshots count
+    screenshots = get_screenshots()
+    recent_screenshots = len([s for s in screenshots if time.time() - s['modified_timestamp'] < 3600])  # Last hour
 
-    return Response(generate(), mimetype='text/plain')
+    return {
+        'app_running': app_running,
+        'log_file_exists': log_exists,
+        'last_log_time': last_log_time,
+        'recent_screenshots': recent_screenshots,
+        'total_screenshots': len(screenshots),
+        'app_status': app_status_data['status'],
+        'meeting_info': app_status_data.get('meeting_info', {}),
+        'status_timestamp': app_status_data.get('timestamp')
+    }
 
 @app.route('/api/status')
 def get_status():
-    """Get comprehensive application status"""
+    """Get comprehensive application status (cached for a second)"""
     try:
-        app_status_data = get_app_status()
-        
-        # Check if log file exists and get last modified time
-        log_exists = os.path.exists(LOG_FILE)
-        last_log_time = None
-        if log_exists:
-            last_log_time = datetime.datetime.fromtimestamp(os.path.getmtime(LOG_FILE)).isoformat()
-
-        # Check if main application is running (based on recent log activity)
-        app_running = False
-        if log_exists:
-            current_time = time.time()
-            log_modified_time = os.path.getmtime(LOG_FILE)
-            app_running = (current_time - log_modified_time) < 300  # 5 minutes
-
-        # Get recent screenshots count
-        screenshots = get_screenshots()
-        recent_screenshots = len([s for s in screenshots if time.time() - s['modified_timestamp'] < 3600])  # Last hour
-
-        return jsonify({
-            'app_running': app_running,
-            'log_file_exists': log_exists,
-            'last_log_time': last_log_time,
-            'recent_screenshots': recent_screenshots,
-            'total_screenshots': len(screenshots),
-            'app_status': app_status_data['status'],
-            'meeting_info': app_status_data.get('meeting_info', {}),
-            'status_timestamp': app_status_data.get('timestamp')
-        })
+        now = time.monotonic()
+        if _status_cache['payload'] is None or now - _status_cache['ts'] >= _STATUS_CACHE_TTL:
+            with _status_cache_lock:
+                # Re-check under the lock so concurrent pollers rebuild once
+                if _status_cache['payload'] is None or now - _status_cache['ts'] >= _STATUS_CACHE_TTL:
+                    _status_cache['payload'] = _build_status()
+                    _status_cache['ts'] = time.monotonic()
+        return jsonify(_status_cache['payload'])
     except Exception as e:
         return jsonify({'error': str(e)})
 
@@ -196,11 +640,31 @@ def get_status():
 def get_screenshots_api():
     """API endpoint to get available screenshots"""
     screenshots = get_screenshots()
-    return jsonify({'screenshots': screenshots})
+
+    newest = max((s['modified_timestamp'] for s in screenshots), default=0)
+    etag = f"{int(newest * 1000):x}-{len(screenshots):x}"
+    if etag in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+    response = jsonify({'screenshots': screenshots})
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/screenshot/trigger')
 def trigger_screenshot():
     """API endpoint to trigger a screenshot"""
+    # Ping the joiner's trigger socket for an instant wake-up; fall back to
+    # the trigger file if the joiner is down or hasn't bound the socket yet
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.sendto(b'1', SCREENSHOT_TRIGGER_SOCKET)
+            return jsonify({'success': True, 'message': 'Screenshot triggered successfully!'})
+        finally:
+            sock.close()
+    except OSError:
+        pass
+
     try:
         # Create the trigger file
         with open(SCREENSHOT_TRIGGER_FILE, 'w') as f:
@@ -209,937 +673,56 @@ def trigger_screenshot():
     except Exception as e:
         return jsonify({'success': False, 'message': f'Error triggering screenshot: {str(e)}'})
 
+# Candidate screenshot directories, filtered once at import so missing ones
+# are never probed per request
+_SERVE_DIRS = [d for d in (
+    SCREENSHOTS_DIR,
+    os.path.join(LOGS_DIR, "screenshots"),
+    LOGS_DIR,
+    "/tmp/screenshots",
+    "/tmp"
+) if os.path.isdir(d)]
+
+# Screenshot names are always screenshot_<description>_<timestamp>.<ext>;
+# reject anything else (including traversal attempts) before touching disk
+_SAFE_SCREENSHOT_NAME = re.compile(r'\Ascreenshot_[A-Za-z0-9._-]+\.(?:png|webp)\Z')
+
+@functools.lru_cache(maxsize=256)
+def _locate_screenshot(filename):
+    """Find which directory holds a screenshot (cached across requests)"""
+    for directory in _SERVE_DIRS:
+        if os.path.isfile(os.path.join(directory, filename)):
+            return directory
+    return None
+
 @app.route('/screenshots/<path:filename>')
 def serve_screenshot(filename):
-    """Serve screenshot files"""
-    # Try different possible directories
-    possible_dirs = [
-        SCREENSHOTS_DIR,
-        os.path.join(LOGS_DIR, "screenshots"),
-        LOGS_DIR,
-        "/tmp/screenshots",
-        "/tmp"
-    ]
+    """Serve screenshot files with conditional-GET caching"""
+    if not _SAFE_SCREENSHOT_NAME.match(filename):
+        return "Screenshot not found", 404
 
-    for directory in possible_dirs:
+    directory = _locate_screenshot(filename)
+    if directory:
         filepath = os.path.join(directory, filename)
-        if os.path.exists(filepath):
-            return send_from_directory(directory, filename)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            # File was cleaned up since we cached its location
+            _locate_screenshot.cache_clear()
+        else:
+            # Screenshots never change after they are written, so an
+            # mtime+size ETag lets repeat loads come back as 304s
+            etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+            if etag in request.if_none_match:
+                return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+            response = send_from_directory(directory, filename, conditional=True)
+            response.set_etag(etag)
+            response.cache_control.max_age = 60
+            return response
 
     return "Screenshot not found", 404
 
-# Enhanced HTML Template with Mobile Responsiveness and Meeting Info
-ENHANCED_DASHBOARD_HTML = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Auto Class Joiner Dashboard</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 10px;
-        }
-
-        .dashboard {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-            overflow: hidden;
-        }
-
-        .header {
-            background: linear-gradient(135deg, #2c3e50, #3498db);
-            color: white;
-            padding: 20px;
-            text-align: center;
-        }
-
-        .header h1 {
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-
-        .status-bar {
-            display: flex;
-            justify-content: center;
-            flex-wrap: wrap;
-            gap: 20px;
-            margin-top: 20px;
-        }
-
-        .status-item {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            padding: 10px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-        }
-
-        .status-indicator {
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            background: #e74c3c;
-        }
-
-        .status-indicator.active {
-            background: #2ecc71;
-            animation: pulse 2s infinite;
-        }
-
-        .status-indicator.warning {
-            background: #f39c12;
-        }
-
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.5; }
-            100% { opacity: 1; }
-        }
-
-        /* Meeting Status Panel */
-        .meeting-status {
-            background: linear-gradient(135deg, #8e44ad, #9b59b6);
-            color: white;
-            padding: 20px;
-            margin: 20px;
-            border-radius: 10px;
-            display: none;
-        }
-
-        .meeting-status.active {
-            display: block;
-        }
-
-        .meeting-title {
-            font-size: 1.5em;
-            margin-bottom: 10px;
-        }
-
-        .meeting-details {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-        }
-
-        .meeting-detail {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 10px;
-            border-radius: 5px;
-        }
-
-        .meeting-detail-label {
-            font-weight: bold;
-            margin-bottom: 5px;
-        }
-
-        .main-content {
-            padding: 20px;
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            min-height: 600px;
-        }
-
-        .panel {
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.08);
-            overflow: hidden;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .panel-header {
-            background: #f8f9fa;
-            padding: 15px;
-            border-bottom: 1px solid #e9ecef;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 10px;
-        }
-
-        .panel-header h3 {
-            color: #2c3e50;
-            font-size: 1.3em;
-        }
-
-        .panel-controls {
-            display: flex;
-            gap: 10px;
-            align-items: center;
-            flex-wrap: wrap;
-        }
-
-        .btn {
-            background: #3498db;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 12px;
-            transition: background 0.3s;
-            white-space: nowrap;
-        }
-
-        .btn:hover {
-            background: #2980b9;
-        }
-
-        .btn:disabled {
-            background: #95a5a6;
-            cursor: not-allowed;
-        }
-
-        .btn.success {
-            background: #27ae60;
-        }
-
-        .btn.success:hover {
-            background: #229954;
-        }
-
-        .btn.small {
-            padding: 6px 12px;
-            font-size: 11px;
-        }
-
-        .logs-container {
-            height: 500px;
-            overflow-y: auto;
-            background: #1e1e1e;
-            color: #f8f8f2;
-            font-family: 'Courier New', monospace;
-            font-size: 12px;
-            padding: 15px;
-            flex-grow: 1;
-        }
-
-        .log-line {
-            margin-bottom: 3px;
-            padding: 2px 0;
-            word-wrap: break-word;
-            line-height: 1.4;
-        }
-
-        .log-line.info {
-            color: #8be9fd;
-        }
-
-        .log-line.error {
-            color: #ff5555;
-            background: rgba(255, 85, 85, 0.1);
-            padding: 3px;
-            border-radius: 3px;
-        }
-
-        .log-line.warning {
-            color: #ffb86c;
-            background: rgba(255, 184, 108, 0.1);
-            padding: 3px;
-            border-radius: 3px;
-        }
-
-        .screenshots-grid {
-            padding: 15px;
-            max-height: 500px;
-            overflow-y: auto;
-            flex-grow: 1;
-        }
-
-        .screenshot-item {
-            display: flex;
-            align-items: center;
-            padding: 10px;
-            border-bottom: 1px solid #e9ecef;
-            transition: background 0.3s;
-        }
-
-        .screenshot-item:hover {
-            background: #f8f9fa;
-        }
-
-        .screenshot-thumb {
-            width: 80px;
-            height: 60px;
-            object-fit: cover;
-            border-radius: 5px;
-            margin-right: 15px;
-            cursor: pointer;
-        }
-
-        .screenshot-info {
-            flex-grow: 1;
-            min-width: 0;
-        }
-
-        .screenshot-filename {
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 5px;
-            word-break: break-all;
-        }
-
-        .screenshot-meta {
-            color: #7f8c8d;
-            font-size: 11px;
-        }
-
-        .auto-refresh {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .auto-refresh input[type="checkbox"] {
-            transform: scale(1.2);
-        }
-
-        .loading {
-            text-align: center;
-            padding: 40px;
-            color: #7f8c8d;
-        }
-
-        .controls {
-            background: #f8f9fa;
-            padding: 15px;
-            border-top: 1px solid #e9ecef;
-            display: flex;
-            gap: 10px;
-            justify-content: center;
-            flex-wrap: wrap;
-        }
-
-        .notification {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            padding: 15px 25px;
-            background: #27ae60;
-            color: white;
-            border-radius: 5px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);
-            z-index: 1000;
-            opacity: 0;
-            transform: translateX(100%);
-            transition: all 0.3s ease;
-            max-width: calc(100vw - 40px);
-        }
-
-        .notification.show {
-            opacity: 1;
-            transform: translateX(0);
-        }
-
-        .notification.error {
-            background: #e74c3c;
-        }
-
-        .log-stats {
-            background: #f8f9fa;
-            padding: 10px 15px;
-            border-bottom: 1px solid #e9ecef;
-            font-size: 12px;
-            color: #7f8c8d;
-        }
-
-        /* Mobile Responsive Styles */
-        @media (max-width: 768px) {
-            body {
-                padding: 5px;
-            }
-
-            .header h1 {
-                font-size: 1.8em;
-            }
-
-            .status-bar {
-                flex-direction: column;
-                gap: 10px;
-            }
-
-            .status-item {
-                justify-content: center;
-            }
-
-            .main-content {
-                grid-template-columns: 1fr;
-                gap: 15px;
-                padding: 15px;
-            }
-
-            .panel-header {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 10px;
-            }
-
-            .panel-controls {
-                width: 100%;
-                justify-content: space-between;
-            }
-
-            .logs-container {
-                height: 400px;
-                font-size: 11px;
-                padding: 10px;
-            }
-
-            .screenshots-grid {
-                height: 400px;
-                padding: 10px;
-            }
-
-            .screenshot-item {
-                flex-direction: column;
-                align-items: flex-start;
-            }
-
-            .screenshot-thumb {
-                width: 100%;
-                height: 120px;
-                margin-right: 0;
-                margin-bottom: 10px;
-            }
-
-            .controls {
-                flex-direction: column;
-                gap: 10px;
-            }
-
-            .meeting-details {
-                grid-template-columns: 1fr;
-            }
-
-            .notification {
-                right: 10px;
-                left: 10px;
-                max-width: none;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .header h1 {
-                font-size: 1.5em;
-            }
-
-            .logs-container {
-                height: 300px;
-                font-size: 10px;
-            }
-
-            .screenshots-grid {
-                height: 300px;
-            }
-
-            .btn {
-                padding: 6px 12px;
-                font-size: 11px;
-            }
-        }
-
-        /* Dark mode for logs */
-        @media (prefers-color-scheme: dark) {
-            .logs-container {
-                background: #0d1117;
-                color: #c9d1d9;
-            }
-
-            .log-line.info {
-                color: #79c0ff;
-            }
-
-            .log-line.error {
-                color: #f85149;
-                background: rgba(248, 81, 73, 0.1);
-            }
-
-            .log-line.warning {
-                color: #d29922;
-                background: rgba(210, 153, 34, 0.1);
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="dashboard">
-        <div class="header">
-            <h1>Auto Class Joiner Dashboard</h1>
-            <div class="status-bar">
-                <div class="status-item">
-                    <div class="status-indicator" id="app-status"></div>
-                    <span id="app-status-text">Checking...</span>
-                </div>
-                <div class="status-item">
-                    <div class="status-indicator" id="log-status"></div>
-                    <span id="log-status-text">Logs: Unknown</span>
-                </div>
-                <div class="status-item">
-                    <div class="status-indicator" id="screenshot-status"></div>
-                    <span id="screenshot-status-text">Screenshots: Unknown</span>
-                </div>
-            </div>
-        </div>
-
-        <!-- Meeting Status Panel -->
-        <div class="meeting-status" id="meeting-status">
-            <div class="meeting-title" id="meeting-title">Meeting in Progress</div>
-            <div class="meeting-details">
-                <div class="meeting-detail">
-                    <div class="meeting-detail-label">Status</div>
-                    <div id="meeting-status-text">Unknown</div>
-                </div>
-                <div class="meeting-detail">
-                    <div class="meeting-detail-label">Meeting ID</div>
-                    <div id="meeting-id">-</div>
-                </div>
-                <div class="meeting-detail">
-                    <div class="meeting-detail-label">Instructor</div>
-                    <div id="meeting-instructor">-</div>
-                </div>
-                <div class="meeting-detail">
-                    <div class="meeting-detail-label">Connection Time</div>
-                    <div id="connection-time">-</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="main-content">
-            <div class="panel">
-                <div class="panel-header">
-                    <h3>Real-time Logs</h3>
-                    <div class="panel-controls">
-                        <div class="auto-refresh">
-                            <input type="checkbox" id="auto-scroll" checked>
-                            <label for="auto-scroll">Auto-scroll</label>
-                        </div>
-                        <button class="btn small" id="show-all-logs">Show All</button>
-                    </div>
-                </div>
-                <div class="log-stats" id="log-stats">
-                    Loading log information...
-                </div>
-                <div class="logs-container" id="logs-container">
-                    <div class="loading">Loading logs...</div>
-                </div>
-            </div>
-
-            <div class="panel">
-                <div class="panel-header">
-                    <h3>Screenshots</h3>
-                    <div class="panel-controls">
-                        <button class="btn success" id="take-screenshot">Take Screenshot</button>
-                        <button class="btn small" id="refresh-screenshots-btn">Refresh</button>
-                    </div>
-                </div>
-                <div class="screenshots-grid" id="screenshots-container">
-                    <div class="loading">Loading screenshots...</div>
-                </div>
-            </div>
-        </div>
-
-        <div class="controls">
-            <button class="btn" id="refresh-logs">Refresh Logs</button>
-            <button class="btn" id="clear-logs">Clear Display</button>
-            <button class="btn" id="refresh-all">Refresh All</button>
-        </div>
-    </div>
-
-    <div class="notification" id="notification"></div>
-
-    <script>
-        class EnhancedDashboard {
-            constructor() {
-                this.autoScroll = true;
-                this.showingAllLogs = false;
-                this.eventSource = null;
-                this.init();
-            }
-
-            init() {
-                this.bindEvents();
-                this.loadInitialData();
-                this.startRealTimeUpdates();
-                this.updateStatus();
-
-                // Update status every 15 seconds for more responsive meeting info
-                setInterval(() => this.updateStatus(), 15000);
-                // Refresh screenshots every 60 seconds
-                setInterval(() => this.loadScreenshots(), 60000);
-            }
-
-            bindEvents() {
-                document.getElementById('take-screenshot').addEventListener('click', () => this.takeScreenshot());
-                document.getElementById('refresh-logs').addEventListener('click', () => this.loadLogs());
-                document.getElementById('refresh-screenshots-btn').addEventListener('click', () => this.loadScreenshots());
-                document.getElementById('clear-logs').addEventListener('click', () => this.clearLogs());
-                document.getElementById('refresh-all').addEventListener('click', () => this.refreshAll());
-                document.getElementById('show-all-logs').addEventListener('click', () => this.toggleAllLogs());
-                document.getElementById('auto-scroll').addEventListener('change', (e) => {
-                    this.autoScroll = e.target.checked;
-                });
-            }
-
-            async loadInitialData() {
-                await Promise.all([
-                    this.loadLogs(),
-                    this.loadScreenshots()
-                ]);
-            }
-
-            async loadLogs() {
-                try {
-                    const url = this.showingAllLogs ? '/api/logs?all=true' : '/api/logs?lines=200';
-                    const response = await fetch(url);
-                    const data = await response.json();
-                    this.displayLogs(data.logs, false);
-                    this.updateLogStats(data.total, data.logs.length);
-                } catch (error) {
-                    console.error('Error loading logs:', error);
-                    this.showNotification('Error loading logs', 'error');
-                }
-            }
-
-            async toggleAllLogs() {
-                const button = document.getElementById('show-all-logs');
-                this.showingAllLogs = !this.showingAllLogs;
-                
-                if (this.showingAllLogs) {
-                    button.textContent = 'Show Recent';
-                    button.disabled = true;
-                    this.showNotification('Loading all logs...');
-                    await this.loadLogs();
-                    button.disabled = false;
-                } else {
-                    button.textContent = 'Show All';
-                    await this.loadLogs();
-                }
-            }
-
-            updateLogStats(total, showing) {
-                const statsElement = document.getElementById('log-stats');
-                const status = this.showingAllLogs ? `Showing all ${total} logs` : `Showing ${showing} of ${total} logs`;
-                statsElement.textContent = status;
-            }
-
-            async loadScreenshots() {
-                try {
-                    const response = await fetch('/api/screenshots');
-                    const data = await response.json();
-                    this.displayScreenshots(data.screenshots);
-                } catch (error) {
-                    console.error('Error loading screenshots:', error);
-                    this.showNotification('Error loading screenshots', 'error');
-                }
-            }
-
-            async refreshAll() {
-                const button = document.getElementById('refresh-all');
-                const originalText = button.textContent;
-                button.disabled = true;
-                button.textContent = 'Refreshing...';
-
-                try {
-                    await Promise.all([
-                        this.loadLogs(),
-                        this.loadScreenshots(),
-                        this.updateStatus()
-                    ]);
-                    this.showNotification('Dashboard refreshed successfully!');
-                } catch (error) {
-                    this.showNotification('Error refreshing dashboard', 'error');
-                } finally {
-                    button.disabled = false;
-                    button.textContent = originalText;
-                }
-            }
-
-            async updateStatus() {
-                try {
-                    const response = await fetch('/api/status');
-                    const data = await response.json();
-
-                    // Update app status
-                    const appStatus = document.getElementById('app-status');
-                    const appStatusText = document.getElementById('app-status-text');
-                    if (data.app_running) {
-                        appStatus.classList.add('active');
-                        appStatus.classList.remove('warning');
-                        appStatusText.textContent = `App: ${data.app_status || 'Running'}`;
-                    } else {
-                        appStatus.classList.remove('active');
-                        appStatus.classList.add('warning');
-                        appStatusText.textContent = 'App: Stopped';
-                    }
-
-                    // Update log status
-                    const logStatus = document.getElementById('log-status');
-                    const logStatusText = document.getElementById('log-status-text');
-                    if (data.log_file_exists) {
-                        logStatus.classList.add('active');
-                        logStatusText.textContent = 'Logs: Active';
-                    } else {
-                        logStatus.classList.remove('active');
-                        logStatusText.textContent = 'Logs: No file';
-                    }
-
-                    // Update screenshot status
-                    const screenshotStatus = document.getElementById('screenshot-status');
-                    const screenshotStatusText = document.getElementById('screenshot-status-text');
-                    if (data.total_screenshots > 0) {
-                        screenshotStatus.classList.add('active');
-                        screenshotStatusText.textContent = `Screenshots: ${data.total_screenshots} total, ${data.recent_screenshots} recent`;
-                    } else {
-                        screenshotStatus.classList.remove('active');
-                        screenshotStatusText.textContent = 'Screenshots: None';
-                    }
-
-                    // Update meeting information
-                    this.updateMeetingStatus(data.meeting_info, data.app_status);
-                    
-                } catch (error) {
-                    console.error('Error updating status:', error);
-                }
-            }
-
-            updateMeetingStatus(meetingInfo, appStatus) {
-                const meetingPanel = document.getElementById('meeting-status');
-                const meetingTitle = document.getElementById('meeting-title');
-                const meetingStatusText = document.getElementById('meeting-status-text');
-                const meetingId = document.getElementById('meeting-id');
-                const meetingInstructor = document.getElementById('meeting-instructor');
-                const connectionTime = document.getElementById('connection-time');
-
-                // Check if there's active meeting info
-                if (meetingInfo && Object.keys(meetingInfo).length > 0) {
-                    meetingPanel.classList.add('active');
-                    
-                    // Update meeting details
-                    if (meetingInfo.title) {
-                        meetingTitle.textContent = meetingInfo.title;
-                    } else {
-                        meetingTitle.textContent = 'Active Meeting';
-                    }
-
-                    meetingStatusText.textContent = this.formatMeetingStatus(meetingInfo.status, appStatus);
-                    meetingId.textContent = meetingInfo.id || '-';
-                    meetingInstructor.textContent = meetingInfo.instructor || '-';
-                    
-                    // Show connection time remaining if available
-                    if (meetingInfo.connection_remaining) {
-                        const minutes = Math.floor(meetingInfo.connection_remaining / 60);
-                        const seconds = meetingInfo.connection_remaining % 60;
-                        connectionTime.textContent = `${minutes}:${seconds.toString().padStart(2, '0')} remaining`;
-                    } else if (meetingInfo.status === 'connected') {
-                        connectionTime.textContent = 'Connected';
-                    } else {
-                        connectionTime.textContent = '-';
-                    }
-                } else {
-                    // Check if we should show the panel based on app status
-                    if (appStatus && (appStatus.includes('meeting') || appStatus.includes('Meeting') || appStatus.includes('Connecting'))) {
-                        meetingPanel.classList.add('active');
-                        meetingTitle.textContent = 'Class Session Activity';
-                        meetingStatusText.textContent = appStatus;
-                        meetingId.textContent = '-';
-                        meetingInstructor.textContent = '-';
-                        connectionTime.textContent = '-';
-                    } else {
-                        meetingPanel.classList.remove('active');
-                    }
-                }
-            }
-
-            formatMeetingStatus(status, appStatus) {
-                const statusMap = {
-                    'found': 'Meeting Detected',
-                    'connecting': 'Connecting to Meeting',
-                    'connected': 'Connected to Meeting',
-                    'fetch_failed': 'Failed to Fetch Meeting Details',
-                    'url_failed': 'Failed to Extract Session URL',
-                    'token_failed': 'Failed to Get Session Token',
-                    'error': 'Connection Error'
-                };
-                
-                return statusMap[status] || appStatus || 'Unknown Status';
-            }
-
-            startRealTimeUpdates() {
-                // Use polling for better compatibility
-                this.startPolling();
-            }
-
-            startPolling() {
-                // Poll for new logs every 3 seconds
-                setInterval(async () => {
-                    if (!this.showingAllLogs) { // Only poll when showing recent logs
-                        try {
-                            const response = await fetch('/api/logs?lines=10');
-                            const data = await response.json();
-                            if (data.logs.length > 0) {
-                                const container = document.getElementById('logs-container');
-                                const lastLog = container.lastElementChild?.textContent;
-                                const newLog = data.logs[data.logs.length - 1];
-                                if (lastLog !== newLog) {
-                                    this.appendLog(newLog);
-                                }
-                            }
-                        } catch (error) {
-                            console.error('Polling error:', error);
-                        }
-                    }
-                }, 3000);
-            }
-
-            displayLogs(logs, append = false) {
-                const container = document.getElementById('logs-container');
-                if (!append) {
-                    container.innerHTML = '';
-                }
-
-                logs.forEach(log => {
-                    this.appendLog(log, false);
-                });
-
-                if (this.autoScroll) {
-                    container.scrollTop = container.scrollHeight;
-                }
-            }
-
-            appendLog(logText, scroll = true) {
-                const container = document.getElementById('logs-container');
-                const logElement = document.createElement('div');
-                logElement.className = 'log-line';
-
-                // Add appropriate class based on log level
-                if (logText.includes('ERROR')) {
-                    logElement.classList.add('error');
-                } else if (logText.includes('WARNING') || logText.includes('WARN')) {
-                    logElement.classList.add('warning');
-                } else if (logText.includes('INFO')) {
-                    logElement.classList.add('info');
-                }
-
-                logElement.textContent = logText;
-                container.appendChild(logElement);
-
-                // Keep only last 1000 log lines to prevent memory issues
-                while (container.children.length > 1000) {
-                    container.removeChild(container.firstChild);
-                }
-
-                if (this.autoScroll && scroll) {
-                    container.scrollTop = container.scrollHeight;
-                }
-            }
-
-            displayScreenshots(screenshots) {
-                const container = document.getElementById('screenshots-container');
-
-                if (screenshots.length === 0) {
-                    container.innerHTML = '<div class="loading">No screenshots available</div>';
-                    return;
-                }
-
-                container.innerHTML = '';
-                screenshots.forEach(screenshot => {
-                    const item = document.createElement('div');
-                    item.className = 'screenshot-item';
-
-                    // Determine screenshot type for better display
-                    const isAutoScreenshot = screenshot.filename.includes('15min_auto');
-                    const typeLabel = isAutoScreenshot ? ' (Auto 15min)' : '';
-
-                    item.innerHTML = `
-                        <img src="/screenshots/${screenshot.filename}" alt="Screenshot" class="screenshot-thumb" 
-                             onclick="window.open('/screenshots/${screenshot.filename}', '_blank')" 
-                             loading="lazy">
-                        <div class="screenshot-info">
-                            <div class="screenshot-filename">${screenshot.filename}${typeLabel}</div>
-                            <div class="screenshot-meta">
-                                ${screenshot.modified} | ${this.formatFileSize(screenshot.size)}
-                            </div>
-                        </div>
-                    `;
-
-                    container.appendChild(item);
-                });
-            }
-
-            async takeScreenshot() {
-                const button = document.getElementById('take-screenshot');
-                const originalText = button.textContent;
-                button.disabled = true;
-                button.textContent = 'Taking...';
-
-                try {
-                    const response = await fetch('/api/screenshot/trigger');
-                    const data = await response.json();
-
-                    if (data.success) {
-                        this.showNotification('Screenshot triggered successfully!');
-                        // Refresh screenshots after a delay
-                        setTimeout(() => this.loadScreenshots(), 5000);
-                    } else {
-                        this.showNotification(data.message || 'Failed to trigger screenshot', 'error');
-                    }
-                } catch (error) {
-                    this.showNotification('Error triggering screenshot', 'error');
-                } finally {
-                    button.disabled = false;
-                    button.textContent = originalText;
-                }
-            }
-
-            clearLogs() {
-                document.getElementById('logs-container').innerHTML = '';
-                document.getElementById('log-stats').textContent = 'Display cleared';
-            }
-
-            formatFileSize(bytes) {
-                if (bytes === 0) return '0 B';
-                const k = 1024;
-                const sizes = ['B', 'KB', 'MB', 'GB'];
-                const i = Math.floor(Math.log(bytes) / Math.log(k));
-                return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-            }
-
-            showNotification(message, type = 'success') {
-                const notification = document.getElementById('notification');
-                notification.textContent = message;
-                notification.className = `notification ${type} show`;
-
-                setTimeout(() => {
-                    notification.classList.remove('show');
-                }, 4000);
-            }
-        }
-
-        // Initialize dashboard when DOM is loaded
-        document.addEventListener('DOMContentLoaded', () => {
-            new EnhancedDashboard();
-        });
-    </script>
-</body>
-</html>
-'''
 
 if __name__ == '__main__':
     print("Enhanced Flask Dashboard starting...")
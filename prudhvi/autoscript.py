@@ -6,24 +6,47 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, TimeoutException
-import requests, time, json, logging, os, signal, sys, threading, random, glob
+import requests, time, json, logging, os, re, signal, socket, sys, threading, random, hashlib, base64
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 import datetime
 from PIL import Image
 import io
 import urllib3
+from logging.handlers import RotatingFileHandler
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Parse API responses with orjson when available - the C parser is several
+# times faster than stdlib json on the per-poll meetings payload
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 # Set up logging with file rotation
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('/app/logs_prudhvi/class_joiner.log'),
+        RotatingFileHandler('/app/logs_prudhvi/class_joiner.log',
+                            maxBytes=10_000_000, backupCount=3),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -31,9 +54,15 @@ logger = logging.getLogger(__name__)
 
 # Global variables
 json_token = ""
-active_sessions = []
+# Joined meetings mapped to when they were joined (monotonic); entries older
+# than a day are pruned so the mapping stays bounded over a semester
+active_sessions = {}
+ACTIVE_SESSION_TTL = 86400
 driver = None
 running = True
+# Signalled from signal_handler so long waits can be interrupted promptly
+# instead of sleeping through a shutdown request
+_stop = threading.Event()
 screenshot_thread = None
 cleanup_thread = None
 meeting_screenshot_thread = None
@@ -41,12 +70,51 @@ current_meeting_active = False
 current_meeting_info = {}
 app_status = "Starting"
 
+# Candidate screenshot directories in order of preference; the writable one
+# is probed once and cached instead of being retested on every screenshot
+SCREENSHOT_DIRS = [
+    '/app/screenshots_prudhvi',
+    '/app/logs_prudhvi/screenshots',
+    '/app/logs_prudhvi',
+    '/tmp/screenshots',
+    '/tmp'
+]
+_screenshot_dir = None
+_screenshot_dir_lock = threading.Lock()
+
+def _resolve_screenshot_dir():
+    """Probe for a writable screenshot directory, memoizing the answer"""
+    global _screenshot_dir
+    if _screenshot_dir is not None:
+        return _screenshot_dir
+    with _screenshot_dir_lock:
+        if _screenshot_dir is not None:
+            return _screenshot_dir
+        for dir_path in SCREENSHOT_DIRS:
+            try:
+                os.makedirs(dir_path, exist_ok=True)
+                # Test write permissions
+                test_file = os.path.join(dir_path, 'test_write.tmp')
+                with open(test_file, 'w') as f:
+                    f.write('test')
+                os.remove(test_file)
+                _screenshot_dir = dir_path
+                return dir_path
+            except (OSError, PermissionError):
+                logger.debug("Cannot write to directory: %s", dir_path)
+        return None
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully"""
-    global running, driver, screenshot_thread, cleanup_thread, meeting_screenshot_thread
+    global running, driver, screenshot_thread, cleanup_thread, meeting_screenshot_thread, app_status
     logger.info(f"Received signal {signum}. Shutting down gracefully...")
     running = False
-    update_app_status("Shutting down")
+    _stop.set()
+    # The handler runs on the main thread, which may have been interrupted
+    # while holding _status_lock - go through the lock-free writer directly
+    # rather than the debounced path
+    app_status = "Shutting down"
+    _write_app_status()
     if driver:
         try:
             driver.quit()
@@ -59,40 +127,92 @@ def signal_handler(signum, frame):
 signal.signal(signal.SIGTERM, signal_handler)
 signal.signal(signal.SIGINT, signal_handler)
 
-def update_app_status(status, meeting_info=None):
-    """Update application status for dashboard"""
-    global app_status, current_meeting_info
-    app_status = status
-    if meeting_info:
-        current_meeting_info = meeting_info
-    
-    # Write status to a file for the dashboard to read
+# Debounce state for status writes: bursts of updates during the connect
+# pipeline coalesce into one leading write plus one trailing write carrying
+# the final state, instead of a disk write per intermediate step
+_status_lock = threading.Lock()
+_status_timer = None
+_last_status_write = 0.0
+_STATUS_DEBOUNCE = 0.5
+
+def _write_app_status():
+    """Serialize the current status snapshot and write it atomically.
+
+    Takes no locks, so it is safe to call from the signal handler even if
+    the interrupted thread was holding _status_lock at the time.
+    """
     try:
         status_data = {
             "status": app_status,
             "timestamp": datetime.datetime.now().isoformat(),
             "meeting_info": current_meeting_info
         }
-        with open('/app/logs_prudhvi/app_status.json', 'w') as f:
-            json.dump(status_data, f)
+        # Write-then-rename so the dashboard never reads a half-written file
+        status_path = '/app/logs_prudhvi/app_status.json'
+        tmp_path = status_path + '.tmp'
+        _write_bytes(tmp_path, _json_dumps(status_data))
+        os.rename(tmp_path, status_path)
     except Exception as e:
         logger.error(f"Error writing status file: {e}")
 
+def _flush_app_status():
+    """Clear any pending trailing flush and write the status file"""
+    global _status_timer, _last_status_write
+    with _status_lock:
+        if _status_timer is not None:
+            _status_timer.cancel()
+            _status_timer = None
+        _last_status_write = time.monotonic()
+    _write_app_status()
+
+def update_app_status(status, meeting_info=None, flush=False):
+    """Update application status for dashboard.
+
+    flush=True bypasses the debounce and writes synchronously - the
+    trailing flush runs on a daemon Timer, which the interpreter kills at
+    exit, so shutdown paths must not rely on it.
+    """
+    global app_status, current_meeting_info, _status_timer
+    app_status = status
+    if meeting_info:
+        current_meeting_info = meeting_info
+
+    if flush:
+        _flush_app_status()
+        return
+
+    with _status_lock:
+        flush_now = time.monotonic() - _last_status_write >= _STATUS_DEBOUNCE
+        if not flush_now and _status_timer is None:
+            # Trailing flush picks up whatever the globals hold by then,
+            # so the last update of a burst always lands on disk
+            _status_timer = threading.Timer(_STATUS_DEBOUNCE, _flush_app_status)
+            _status_timer.daemon = True
+            _status_timer.start()
+    if flush_now:
+        _flush_app_status()
+
 def cleanup_logs_on_startup():
     """Clean up logs on startup only"""
     try:
         # Clean up log files only on startup
         log_dirs = ['/app/logs_prudhvi', '/app/logs']
         for log_dir in log_dirs:
-            if os.path.exists(log_dir):
-                log_files = glob.glob(os.path.join(log_dir, '*.log'))
-                for log_file in log_files:
+            try:
+                entries = os.scandir(log_dir)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith('.log'):
+                        continue
                     try:
-                        with open(log_file, 'w') as f:
-                            f.write('')  # Clear the log file
-                        logger.info(f"Cleared log file on startup: {log_file}")
-                    except Exception as e:
-                        logger.error(f"Could not clear log file {log_file}: {e}")
+                        os.truncate(entry.path, 0)  # Clear the log file
+                        logger.info(f"Cleared log file on startup: {entry.path}")
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.error(f"Could not clear log file {entry.path}: {e}")
 
     except Exception as e:
         logger.error(f"Error in cleanup_logs_on_startup: {e}")
@@ -101,24 +221,22 @@ def cleanup_screenshots_on_startup():
     """Clean up all screenshots on startup only"""
     try:
         # Clean up all screenshots only on startup
-        screenshot_dirs = [
-            '/app/screenshots_prudhvi',
-            '/app/logs_prudhvi/screenshots',
-            '/app/logs_prudhvi',
-            '/tmp/screenshots',
-            '/tmp'
-        ]
-        
         deleted_count = 0
-        for dir_path in screenshot_dirs:
-            if os.path.exists(dir_path):
-                screenshot_files = glob.glob(os.path.join(dir_path, 'screenshot_*.png'))
-                for screenshot_file in screenshot_files:
+        for dir_path in SCREENSHOT_DIRS:
+            try:
+                entries = os.scandir(dir_path)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith('screenshot_') and name.endswith(('.png', '.webp'))):
+                        continue
                     try:
-                        os.remove(screenshot_file)
+                        os.remove(entry.path)
                         deleted_count += 1
                     except Exception as e:
-                        logger.debug(f"Could not delete screenshot {screenshot_file}: {e}")
+                        logger.debug("Could not delete screenshot %s: %s", entry.path, e)
 
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} screenshot files on startup")
@@ -129,29 +247,32 @@ def cleanup_screenshots_on_startup():
 def cleanup_old_screenshots():
     """Clean up screenshots older than 12 hours"""
     try:
-        screenshot_dirs = [
-            '/app/screenshots_prudhvi',
-            '/app/logs_prudhvi/screenshots',
-            '/app/logs_prudhvi',
-            '/tmp/screenshots',
-            '/tmp'
-        ]
         current_time = time.time()
         deleted_count = 0
 
-        for dir_path in screenshot_dirs:
-            if os.path.exists(dir_path):
-                for filename in os.listdir(dir_path):
-                    if filename.startswith('screenshot_') and filename.endswith('.png'):
-                        filepath = os.path.join(dir_path, filename)
-                        try:
-                            file_age = current_time - os.path.getctime(filepath)
-                            if file_age > 43200:  # 12 hours = 43200 seconds
-                                os.remove(filepath)
-                                deleted_count += 1
-                                logger.info(f"Deleted old screenshot: {filename}")
-                        except (OSError, PermissionError) as e:
-                            logger.debug(f"Could not delete {filename}: {e}")
+        # The periodic pass only needs the directory screenshots actually
+        # land in once the probe has run; the startup sweep keeps covering
+        # the full candidate list for leftovers from older runs
+        dirs_to_scan = [_screenshot_dir] if _screenshot_dir else SCREENSHOT_DIRS
+        for dir_path in dirs_to_scan:
+            try:
+                entries = os.scandir(dir_path)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith('screenshot_') and name.endswith(('.png', '.webp'))):
+                        continue
+                    try:
+                        # DirEntry.stat() reuses the data scandir already
+                        # fetched, so no extra stat syscall per file
+                        if current_time - entry.stat().st_ctime > 43200:  # 12 hours
+                            os.remove(entry.path)
+                            deleted_count += 1
+                            logger.info(f"Deleted old screenshot: {name}")
+                    except (OSError, PermissionError) as e:
+                        logger.debug("Could not delete %s: %s", name, e)
 
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old screenshots")
@@ -164,15 +285,21 @@ def cleanup_old_logs():
     try:
         log_dirs = ['/app/logs_prudhvi', '/app/logs']
         for log_dir in log_dirs:
-            if os.path.exists(log_dir):
-                log_files = glob.glob(os.path.join(log_dir, '*.log'))
-                for log_file in log_files:
+            try:
+                entries = os.scandir(log_dir)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith('.log'):
+                        continue
                     try:
-                        with open(log_file, 'w') as f:
-                            f.write('')  # Clear the log file
-                        logger.info(f"Cleared log file: {log_file}")
-                    except Exception as e:
-                        logger.error(f"Could not clear log file {log_file}: {e}")
+                        os.truncate(entry.path, 0)  # Clear the log file
+                        logger.info(f"Cleared log file: {entry.path}")
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.error(f"Could not clear log file {entry.path}: {e}")
 
     except Exception as e:
         logger.error(f"Error in cleanup_old_logs: {e}")
@@ -188,39 +315,73 @@ def periodic_cleanup():
     
     while running:
         try:
-            # Wait for 12 hours (43200 seconds)
-            for _ in range(4320):  # Check every 10 seconds for shutdown
-                if not running:
-                    break
-                time.sleep(10)
-            
+            # Block in the kernel for the whole 12 hours; the stop event
+            # wakes us immediately on shutdown instead of every 10 seconds
+            if _stop.wait(timeout=43200):
+                break
+
             if running:
                 logger.info("Performing periodic cleanup - logs and screenshots (12-hour interval)")
                 cleanup_old_logs()
                 cleanup_old_screenshots()
-                
+
         except Exception as e:
             logger.error(f"Error in periodic cleanup: {e}")
-            time.sleep(60)
+            _stop.wait(60)
 
     logger.info("Periodic cleanup stopped")
 
 # Load configuration
 try:
     with open("/app/config.json", "r") as f:
-        config = json.load(f)
+        config = _json_loads(f.read())
     logger.info("Configuration loaded successfully")
 except FileNotFoundError:
     logger.error("config.json not found in /app/. Please mount the configuration file.")
     sys.exit(1)
-except json.JSONDecodeError as e:
+except ValueError as e:
     logger.error(f"Invalid JSON in config file: {e}")
     sys.exit(1)
 
-BASE_URL = f"https://{config['university_name_codetantra']}.codetantra.com"
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Endpoint URLs derived from config.json, computed once at import.
+
+    Frozen + slots keeps the hot polling path to plain attribute reads
+    instead of rebuilding BASE_URL + "..." strings on every call.
+    """
+    BASE_URL: str
+    LOGIN_URL: str
+    MF_URL: str
+    JNR_URL_PREFIX: str
+    MI_REFERER: str
+
+_base_url = f"https://{config['university_name_codetantra']}.codetantra.com"
+CFG = Config(
+    BASE_URL=_base_url,
+    LOGIN_URL=_base_url + "/r/l/p",
+    MF_URL=_base_url + "/secure/rest/dd/mf",
+    JNR_URL_PREFIX=_base_url + "/secure/tla/jnr.jsp?m=",
+    MI_REFERER=_base_url + "/secure/tla/mi.jsp",
+)
+BASE_URL = CFG.BASE_URL
 USERNAME = config["username"]
 PASSWORD = config["password"]
 
+# Static request headers built once at import; per-call dicts only merge in
+# the session cookie (the User-Agent is a SESSION default)
+_FORM_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Referer": config["myclass_url"]
+}
+_JSON_HEADERS = {
+    "Referer": CFG.MI_REFERER,
+    "Content-Type": "application/json"
+}
+_PAGE_HEADERS = {
+    "Referer": CFG.MI_REFERER
+}
+
 def create_session_with_retry():
     """Create a requests session with retry strategy and SSL handling"""
     session = requests.Session()
@@ -233,15 +394,94 @@ def create_session_with_retry():
         backoff_factor=1
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=4)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
-    
+
     # Disable SSL verification to handle certificate issues
     session.verify = False
-    
+
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    })
+
     return session
 
+# One pooled session shared by all HTTP helpers - keep-alive reuses the TLS
+# connection across poll cycles instead of paying a handshake per request
+SESSION = create_session_with_retry()
+
+def _reset_session():
+    """Discard the pooled session after SSL trouble so a poisoned TLS
+    connection does not linger in the keep-alive pool"""
+    global SESSION
+    try:
+        SESSION.close()
+    except Exception:
+        pass
+    SESSION = create_session_with_retry()
+
+# Chrome launch flags, deduplicated into one source of truth. Dropped from
+# the old list: duplicate entries, --enable-features=NetworkServiceLogging
+# (slows the network stack with logging), --force-fieldtrials=
+# *BackgroundTracing/default/ (enables tracing) and --enable-automation
+# (fought the excludeSwitches below). Profile- and image-related flags stay
+# in setup_headless_driver because they depend on env/config.
+CHROME_FLAGS = [
+    # Essential Docker/headless options
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--ignore-ssl-errors=yes",
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors-spki-list",
+    "--disable-extensions-http-throttling",
+    # Fix for DevToolsActivePort issue
+    "--remote-debugging-port=9222",
+    "--run-all-compositor-stages-before-draw",
+    "--disable-background-networking",
+    "--disable-ipc-flooding-protection",
+    "--disable-hang-monitor",
+    "--disable-client-side-phishing-detection",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-domain-reliability",
+    "--disable-component-update",
+    "--disable-background-downloads",
+    "--disable-breakpad",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-back-forward-cache",
+    "--disable-browser-side-navigation",
+    "--disable-single-click-autofill",
+    # Memory and performance optimizations for containers
+    "--memory-pressure-off",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--disable-logging",
+    "--disable-permissions-api",
+    # Window size for headless mode
+    "--window-size=1920,1080",
+    "--start-maximized",
+    # Media stream options
+    "--use-fake-ui-for-media-stream",
+    "--use-fake-device-for-media-stream",
+    "--allow-running-insecure-content",
+    "--disable-blink-features=AutomationControlled",
+]
+
 def setup_headless_driver():
     """Set up Chrome driver optimized for Docker container"""
     try:
@@ -250,79 +490,43 @@ def setup_headless_driver():
 
         chrome_options = Options()
 
-        # Essential Docker/headless options
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--ignore-ssl-errors=yes")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--ignore-ssl-errors-spki-list")
-        chrome_options.add_argument("--disable-extensions-http-throttling")
-
-        # Fix for DevToolsActivePort issue
-        chrome_options.add_argument("--remote-debugging-port=9222")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--run-all-compositor-stages-before-draw")
-        chrome_options.add_argument("--disable-background-networking")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-client-side-phishing-detection")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-        chrome_options.add_argument("--disable-domain-reliability")
-        chrome_options.add_argument("--disable-component-update")
-        chrome_options.add_argument("--disable-background-downloads")
-        chrome_options.add_argument("--disable-breakpad")
-        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-        chrome_options.add_argument("--disable-back-forward-cache")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--enable-features=NetworkService,NetworkServiceLogging")
-        chrome_options.add_argument("--force-fieldtrials=*BackgroundTracing/default/")
-        chrome_options.add_argument("--enable-automation")
-        chrome_options.add_argument("--disable-browser-side-navigation")
-        chrome_options.add_argument("--disable-single-click-autofill")
-
-        # Memory and performance optimizations for containers
-        chrome_options.add_argument("--memory-pressure-off")
-        chrome_options.add_argument("--disable-background-networking")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--hide-scrollbars")
-        chrome_options.add_argument("--metrics-recording-only")
-        chrome_options.add_argument("--mute-audio")
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--safebrowsing-disable-auto-update")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-permissions-api")
-
-        # Window size for headless mode
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--start-maximized")
-
-        # Media stream options
-        chrome_options.add_argument("--use-fake-ui-for-media-stream")
-        chrome_options.add_argument("--use-fake-device-for-media-stream")
-        chrome_options.add_argument("--allow-running-insecure-content")
-
-        # User data directory (create a temporary directory to avoid permission issues)
-        chrome_options.add_argument("--user-data-dir=/tmp/chrome-user-data")
-
-        # Additional stability options (simplified)
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        # Return from driver.get at DOMContentLoaded instead of waiting for
+        # the full load event; connect2class waits on readyState anyway
+        chrome_options.page_load_strategy = 'eager'
+
+        for flag in CHROME_FLAGS:
+            chrome_options.add_argument(flag)
+
+        # Skip image bytes and their render work on the heavy session page;
+        # set load_page_images in config to re-enable for debugging
+        if not config.get("load_page_images"):
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+
+        # User data directory: reuse the persistent chrome_data volume from
+        # docker-compose so restarts keep Chrome's HTTP cache and first-run
+        # state warm instead of rebuilding a profile in tmpfs every boot
+        profile_dir = os.environ.get('CHROME_PROFILE_DIR', '/home/appuser/.config/google-chrome')
+        try:
+            os.makedirs(profile_dir, exist_ok=True)
+        except OSError:
+            profile_dir = '/tmp/chrome-user-data'
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        # Bound cache growth on the persistent volume (100 MB)
+        chrome_options.add_argument("--disk-cache-size=104857600")
+
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
         driver = webdriver.Chrome(options=chrome_options, service=service)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Registered via CDP so the patch runs before any site script on
+        # every navigation, not just on the page loaded at startup
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        })
 
         logger.info("Chrome driver initialized successfully in headless mode")
         return driver
@@ -334,17 +538,10 @@ def setup_headless_driver():
 def login(username, password):
     """Login and get session token with SSL error handling"""
     update_app_status("Logging in")
-    url = BASE_URL + "/r/l/p"
+    url = CFG.LOGIN_URL
     data = f"i={username}&p={password}"
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Referer": config["myclass_url"],
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
     try:
-        session = create_session_with_retry()
-        response = session.post(url, headers=headers, data=data, timeout=30)
+        response = SESSION.post(url, headers=_FORM_HEADERS, data=data, timeout=30)
         
         if response.status_code == 200:
             cookie = response.headers.get("Set-Cookie", "")
@@ -365,45 +562,59 @@ def login(username, password):
         update_app_status(f"Login error: {str(e)[:50]}")
         return ""
 
+# Fixed-shape request body for the meetings endpoint: only the two window
+# timestamps vary, so a template beats dict + json.dumps on every poll
+_MF_WINDOW_MS = 15 * 3600000
+_MF_BODY_TMPL = '{"minDate":%d,"maxDate":%d,"filters":{"showSelf":true,"status":"started,ended,scheduled"}}'
+
 def fetch_meetings(wtj_token):
     """Fetch active meetings with SSL error handling"""
-    url = BASE_URL + "/secure/rest/dd/mf"
+    url = CFG.MF_URL
     time_curr = int(time.time() * 1000)
-    data = json.dumps({
-        "minDate": time_curr - (15 * 3600000),
-        "maxDate": time_curr + (15 * 3600000),
-        "filters": {
-            "showSelf": True,
-            "status": "started,ended,scheduled"
-        }
-    })
+    data = (_MF_BODY_TMPL % (time_curr - _MF_WINDOW_MS, time_curr + _MF_WINDOW_MS)).encode()
 
-    headers = {
-        "cookie": wtj_token,
-        "Referer": BASE_URL + "/secure/tla/mi.jsp",
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    headers = {**_JSON_HEADERS, "cookie": wtj_token}
+    if fetch_meetings._etag:
+        headers["If-None-Match"] = fetch_meetings._etag
 
     try:
-        session = create_session_with_retry()
-        response = session.post(url, headers=headers, data=data, timeout=30)
-        
+        response = SESSION.post(url, headers=headers, data=data, timeout=30)
+
+        # Unchanged meeting list - skip the body and the JSON parse entirely
+        if response.status_code == 304:
+            logger.debug("Meetings list unchanged (304)")
+            return None, None, None
+
         if response.status_code == 200:
-            # Check if response content is empty or not JSON
-            response_text = response.text.strip()
-            if not response_text:
+            fetch_meetings._etag = response.headers.get("ETag")
+
+            # Emptiness means an expired token and must be checked before
+            # the digest short-circuit - otherwise the first empty body gets
+            # remembered and every later one reads as "unchanged"
+            if not response.content:
                 logger.error("Empty response received from meetings API")
                 return "TOKEN_EXPIRED", None
-            
-            # Check if response looks like JSON
-            if not response_text.startswith('{') and not response_text.startswith('['):
-                logger.error(f"Non-JSON response received: {response_text[:200]}...")
-                return "TOKEN_EXPIRED", None
-            
+
+            # Without server ETags, a cheap digest of the body still lets us
+            # skip re-parsing the common "nothing changed" response
+            digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            if fetch_meetings._etag is None and digest == fetch_meetings._digest:
+                logger.debug("Meetings list unchanged (same digest)")
+                return None, None, None
+            fetch_meetings._digest = digest
+
+            # No "looks like JSON" pre-check: it forced a full UTF-8 decode
+            # of the body and the parser's ValueError covers it anyway
             try:
-                meetings_data = response.json()
+                meetings_data = _json_loads(response.content)
                 meetings = meetings_data.get("ref", [])
+
+                # Remember the next scheduled start so the main loop can
+                # poll faster around it and at the normal rate otherwise
+                starts = [m.get("startTime") for m in meetings
+                          if m.get("status") == "scheduled" and m.get("startTime")]
+                fetch_meetings._next_start = min(starts) / 1000 if starts else None
+
                 for meeting in meetings:
                     if meeting.get("status") == "started":
                         logger.info(f"Found active meeting: {meeting.get('title')}")
@@ -415,14 +626,20 @@ def fetch_meetings(wtj_token):
                             "start_time": meeting.get("startTime"),
                             "end_time": meeting.get("endTime")
                         }
+                        # Forget the conditional state while a meeting is
+                        # live: if this join attempt fails, the next poll
+                        # must re-return the meeting even when the payload
+                        # is byte-identical, not read it as "unchanged"
+                        fetch_meetings._etag = None
+                        fetch_meetings._digest = None
                         return (meeting.get("_id"), meeting.get("title"), meeting_info)
                 logger.debug("No active meetings found")
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}. Response: {response_text[:200]}...")
+            except ValueError as e:
+                logger.error(f"JSON decode error: {e}. Response: {response.content[:200]}...")
                 return "TOKEN_EXPIRED", None
                 
         else:
-            logger.error(f"Failed to fetch meetings: {response.status_code} - {response.text[:200]}...")
+            logger.error(f"Failed to fetch meetings: {response.status_code} - {response.content[:200]}...")
             # Token might be expired or SSL issue
             if response.status_code == 401 or response.status_code == 403:
                 return "TOKEN_EXPIRED", None
@@ -437,34 +654,56 @@ def fetch_meetings(wtj_token):
 
     return None, None, None
 
+# Conditional-request state for fetch_meetings
+fetch_meetings._etag = None
+fetch_meetings._digest = None
+fetch_meetings._next_start = None
+
 def fetch_meeting(cookie, meeting_id):
     """Fetch meeting details with SSL error handling"""
-    url = BASE_URL + "/secure/tla/jnr.jsp?m=" + meeting_id
-    headers = {
-        "cookie": cookie,
-        "Referer": BASE_URL + "/secure/tla/mi.jsp",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
+    url = CFG.JNR_URL_PREFIX + meeting_id
     try:
-        session = create_session_with_retry()
-        response = session.get(url, headers=headers, timeout=30)
-        if response.status_code == 200:
-            return response.content.decode('utf-8')
-        else:
-            logger.error(f"Failed to fetch meeting details: {response.status_code}")
+        with SESSION.get(url, headers={**_PAGE_HEADERS, "cookie": cookie},
+                         timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch meeting details: {response.status_code}")
+                return b""
+
+            # The iframe sits early in the page - stream and stop reading as
+            # soon as it has been seen instead of pulling the whole body. The
+            # sliding window keeps enough overlap to catch a match that
+            # straddles a chunk boundary.
+            chunks = []
+            window = b""
+            for chunk in response.iter_content(chunk_size=8192):
+                chunks.append(chunk)
+                window = (window + chunk)[-16384:]
+                if _IFRAME_RE.search(window):
+                    break
+            return b"".join(chunks)
     except Exception as e:
         logger.error(f"Error fetching meeting details: {e}")
-    return ""
+    return b""
+
+# The page is only ever mined for one attribute; a compiled regex over the
+# raw bytes avoids building a full BeautifulSoup tree per join
+_IFRAME_RE = re.compile(rb'<iframe[^>]*\bid=["\']frame["\'][^>]*\bsrc=["\']([^"\']+)', re.IGNORECASE)
 
 def get_session_url(raw_data):
     """Extract session URL from meeting data"""
     try:
+        match = _IFRAME_RE.search(raw_data)
+        if match:
+            src = match.group(1).decode('utf-8', errors='ignore')
+            logger.debug("Found iframe src: %s", src)
+            return src
+
+        # Attribute order the regex doesn't cover - fall back to a full parse
         soup = BeautifulSoup(raw_data, "html.parser")
         frame = soup.find("iframe", {"id": "frame"})
         if frame:
             src = frame.get("src")
-            logger.debug(f"Found iframe src: {src}")
+            logger.debug("Found iframe src: %s", src)
             return src
         logger.error("No iframe with id 'frame' found")
     except Exception as e:
@@ -474,14 +713,10 @@ def get_session_url(raw_data):
 def get_session_token(url):
     """Get session token from URL redirect with SSL handling"""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        session = create_session_with_retry()
-        response = session.head(url, allow_redirects=False, timeout=30, headers=headers)
+        response = SESSION.head(url, allow_redirects=False, timeout=30)
         location = response.headers.get('location')
         if location:
-            logger.debug(f"Got session redirect URL: {location}")
+            logger.debug("Got session redirect URL: %s", location)
             return location
         else:
             logger.error("No redirect location found in response headers")
@@ -489,15 +724,39 @@ def get_session_token(url):
         logger.error(f"Error getting session token: {e}")
     return None
 
-def safe_click_element(driver, xpath, timeout=30, description="element"):
-    """Safely click an element with better error handling"""
-    try:
+# One WebDriverWait per (driver, timeout) and one clickable-predicate per
+# locator; both are rebuilt identically on every click otherwise. The
+# WeakKeyDictionary drops its entries when a driver is quit
+_WAITS = WeakKeyDictionary()
+
+def _get_wait(driver, timeout):
+    per_driver = _WAITS.setdefault(driver, {})
+    wait = per_driver.get(timeout)
+    if wait is None:
         wait = WebDriverWait(driver, timeout)
-        element = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
+        per_driver[timeout] = wait
+    return wait
 
-        # Scroll element into view
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(1)
+@lru_cache(maxsize=32)
+def _clickable(by, selector):
+    return EC.element_to_be_clickable((by, selector))
+
+def safe_click_element(driver, selector, timeout=30, description="element", by=By.XPATH):
+    """Safely click an element with better error handling"""
+    try:
+        wait = _get_wait(driver, timeout)
+        element = wait.until(_clickable(by, selector))
+
+        # Only scroll when the element is actually outside the viewport; the
+        # clickable wait above already guarantees it is interactable, so the
+        # old unconditional scroll + 1s sleep was pure dead time
+        in_view = driver.execute_script(
+            "const r = arguments[0].getBoundingClientRect();"
+            "return r.top >= 0 && r.bottom <= window.innerHeight;",
+            element
+        )
+        if not in_view:
+            driver.execute_script("arguments[0].scrollIntoView(true);", element)
 
         # Try normal click first
         try:
@@ -510,7 +769,7 @@ def safe_click_element(driver, xpath, timeout=30, description="element"):
         return True
 
     except TimeoutException:
-        logger.error(f"Timeout waiting for {description}: {xpath}")
+        logger.error(f"Timeout waiting for {description}: {selector}")
         return False
     except WebDriverException as e:
         logger.error(f"WebDriver exception clicking {description}: {e}")
@@ -523,29 +782,72 @@ def connect2class(driver, url, meeting_info):
         logger.info(f"Navigating to session URL")
         update_app_status("Connecting to meeting", meeting_info)
         driver.get(url)
-        time.sleep(10)  # Wait for page load
+
+        # Wait on actual document readiness instead of a blind 10s sleep;
+        # interactive is enough since the click waits gate on the elements
+        try:
+            _get_wait(driver, 30).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+        except TimeoutException:
+            logger.warning("Page load wait timed out, continuing anyway")
 
         # Mark meeting as active for screenshot monitoring
         current_meeting_active = True
         current_meeting_info = meeting_info
         current_meeting_info["status"] = "connecting"
 
-        # Define the sequence of elements to click
+        # Define the sequence of elements to click. The CSS selector is the
+        # mechanical equivalent of the original absolute XPath - CSS lookups
+        # take Chromium's fast querySelector path - and the XPath is kept as
+        # a fallback in case the evaluators disagree on an edge case.
         click_sequence = [
-            ("/html/body/div[2]/div/div/div[1]/div/div/span/button[1]", "permission dialog button 1"),
-            ("/html/body/div[2]/div/div/div[1]/div/span/button[1]", "permission dialog button 2"),
-            ("/html/body/div/main/section/div/header/div/div[1]/div[1]/button", "main interface button"),
-            ("/html/body/div[1]/main/section/div[1]/div/div/div[2]/div[1]/div[2]/div/div/div/div/div/div[2]/span", "final connect button")
+            ("body > div:nth-of-type(2) > div > div > div:nth-of-type(1) > div > div > span > button:nth-of-type(1)",
+             "/html/body/div[2]/div/div/div[1]/div/div/span/button[1]",
+             "permission dialog button 1"),
+            ("body > div:nth-of-type(2) > div > div > div:nth-of-type(1) > div > span > button:nth-of-type(1)",
+             "/html/body/div[2]/div/div/div[1]/div/span/button[1]",
+             "permission dialog button 2"),
+            ("body > div > main > section > div > header > div > div:nth-of-type(1) > div:nth-of-type(1) > button",
+             "/html/body/div/main/section/div/header/div/div[1]/div[1]/button",
+             "main interface button"),
+            ("body > div:nth-of-type(1) > main > section > div:nth-of-type(1) > div > div > div:nth-of-type(2) > div:nth-of-type(1) > div:nth-of-type(2) > div > div > div > div > div > div:nth-of-type(2) > span",
+             "/html/body/div[1]/main/section/div[1]/div/div/div[2]/div[1]/div[2]/div/div/div/div/div/div[2]/span",
+             "final connect button")
         ]
 
-        for xpath, description in click_sequence:
+        for index, (css, xpath, description) in enumerate(click_sequence):
             logger.info(f"Attempting to click {description}")
-            if not safe_click_element(driver, xpath, timeout=60, description=description):
+            # Fail fast: a missing element is missing, and the main loop
+            # can retry the whole join from fetch_meetings far sooner than
+            # two 30s waits would allow
+            clicked = safe_click_element(driver, css, timeout=15, description=description, by=By.CSS_SELECTOR)
+            if not clicked:
+                clicked = safe_click_element(driver, xpath, timeout=10,
+                                             description=f"{description} (xpath fallback)")
+            if not clicked:
                 # Try alternative selectors or continue
                 logger.warning(f"Failed to click {description}, attempting to continue...")
-                time.sleep(5)
-            else:
-                time.sleep(5)  # Wait between successful clicks
+                continue
+
+            # Wait for the page to react to the click instead of a fixed 5s
+            # pause: either the next element becomes clickable or the one we
+            # just clicked goes away
+            next_css = click_sequence[index + 1][0] if index + 1 < len(click_sequence) else None
+            try:
+                if next_css:
+                    _get_wait(driver, 30).until(
+                        EC.any_of(
+                            _clickable(By.CSS_SELECTOR, next_css),
+                            EC.invisibility_of_element_located((By.CSS_SELECTOR, css))
+                        )
+                    )
+                else:
+                    _get_wait(driver, 10).until(
+                        EC.invisibility_of_element_located((By.CSS_SELECTOR, css))
+                    )
+            except TimeoutException:
+                logger.debug("No visible state change after clicking %s", description)
 
         logger.info("Class connection sequence completed")
         current_meeting_info["status"] = "connected"
@@ -576,6 +878,34 @@ def cleanup_driver(driver):
     # Give threads time to recognize driver is gone
     time.sleep(2)
 
+class FetchError(Exception):
+    """A stage of the meeting-connect pipeline failed; args are (stage, message)"""
+
+def backoff(attempt, base=5, cap=300):
+    """Capped exponential backoff with jitter so parallel attenders do not
+    retry in lockstep after a shared outage"""
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+def _session_alive(driver):
+    """Cheap probe that the browser session is still responsive"""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except WebDriverException:
+        return False
+
+# Small pool for overlapping screenshots with the join sequence; chromedriver
+# serializes commands per session, so concurrent submission is safe
+_EXEC = ThreadPoolExecutor(max_workers=2)
+
+def _write_bytes(filepath, data):
+    """Write a blob with one open/write/close, skipping stdio buffering"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 def take_screenshot(driver, description="status"):
     """Take a screenshot and save it with timestamp"""
     try:
@@ -590,41 +920,45 @@ def take_screenshot(driver, description="status"):
             logger.warning(f"Driver not responsive for screenshot: {e}")
             return None
 
-        # Try multiple screenshot directories in order of preference
-        screenshot_dirs = [
-            '/app/screenshots_prudhvi',
-            '/app/logs_prudhvi/screenshots',
-            '/app/logs_prudhvi',
-            '/tmp/screenshots',
-            '/tmp'
-        ]
-
-        screenshot_dir = None
-        for dir_path in screenshot_dirs:
-            try:
-                os.makedirs(dir_path, exist_ok=True)
-                # Test write permissions
-                test_file = os.path.join(dir_path, 'test_write.tmp')
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-                screenshot_dir = dir_path
-                break
-            except (OSError, PermissionError):
-                logger.debug(f"Cannot write to directory: {dir_path}")
-                continue
-
+        screenshot_dir = _resolve_screenshot_dir()
         if not screenshot_dir:
             logger.error("No writable directory found for screenshots")
             return None
 
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"screenshot_{description}_{timestamp}.png"
-        filepath = os.path.join(screenshot_dir, filename)
 
-        screenshot = driver.get_screenshot_as_png()
-        with open(filepath, 'wb') as f:
-            f.write(screenshot)
+        if config.get("full_res_screenshots"):
+            screenshot = driver.get_screenshot_as_png()
+            filepath = os.path.join(screenshot_dir, f"screenshot_{description}_{timestamp}.png")
+            _write_bytes(filepath, screenshot)
+        else:
+            # CDP JPEG capture skips the browser-side PNG encode and moves a
+            # far smaller base64 blob over the WebDriver transport
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'jpeg',
+                'quality': 60,
+                'captureBeyondViewport': False
+            })
+            screenshot = base64.b64decode(result['data'])
+
+            # A static page produces byte-identical JPEG output; skip the
+            # re-encode and disk write when the periodic shot would just
+            # duplicate the previous one. Manual requests always save.
+            digest = hashlib.blake2b(screenshot, digest_size=8).digest()
+            if description == "meeting_15min_auto" and digest == take_screenshot._last_digest:
+                logger.info("Screen unchanged since last capture, skipping duplicate screenshot")
+                return None
+            take_screenshot._last_digest = digest
+
+            # Half-resolution WebP is roughly 10x smaller on disk than the
+            # raw 1920x1080 PNG with no loss of dashboard readability
+            filepath = os.path.join(screenshot_dir, f"screenshot_{description}_{timestamp}.webp")
+            img = Image.open(io.BytesIO(screenshot))
+            img.thumbnail((960, 540), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, 'WEBP', quality=70, method=4)
+            _write_bytes(filepath, buf.getbuffer())
+
         logger.info(f"Screenshot saved: {filepath}")
         return filepath
 
@@ -632,13 +966,20 @@ def take_screenshot(driver, description="status"):
         logger.error(f"Error taking screenshot: {e}")
         return None
 
+# Digest of the last captured frame, for duplicate suppression
+take_screenshot._last_digest = None
+
+# Datagram socket the dashboard pings to request a screenshot - lives on the
+# shared logs volume so it works across containers
+SCREENSHOT_TRIGGER_SOCKET = '/app/logs_prudhvi/.screenshot_trigger.sock'
+
 def check_for_screenshot_request():
     """Check if user wants a screenshot"""
     screenshot_request_files = [
         '/app/logs_prudhvi/take_screenshot',
         '/app/logs/take_screenshot'
     ]
-    
+
     for screenshot_request_file in screenshot_request_files:
         if os.path.exists(screenshot_request_file):
             try:
@@ -648,15 +989,45 @@ def check_for_screenshot_request():
                 pass
     return False
 
+def open_trigger_socket():
+    """Bind the screenshot trigger socket, replacing any stale one"""
+    try:
+        if os.path.exists(SCREENSHOT_TRIGGER_SOCKET):
+            os.remove(SCREENSHOT_TRIGGER_SOCKET)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(SCREENSHOT_TRIGGER_SOCKET)
+        # Long timeout: the socket delivers requests instantly, so waking is
+        # only needed to service the legacy trigger file now and then
+        sock.settimeout(60)
+        return sock
+    except OSError as e:
+        logger.warning(f"Could not bind screenshot trigger socket: {e}")
+        return None
+
 def screenshot_monitor():
-    """Background thread to monitor for screenshot requests every 5 seconds"""
+    """Background thread waiting for screenshot requests on the trigger socket"""
     global running, driver
-    logger.info("Screenshot monitor started - checking every 5 seconds")
+    logger.info("Screenshot monitor started - waiting for trigger events")
 
-    while running:
+    trigger_socket = open_trigger_socket()
+
+    while running and not _stop.is_set():
         try:
+            requested = False
+            if trigger_socket:
+                try:
+                    trigger_socket.recvfrom(16)
+                    requested = True
+                except socket.timeout:
+                    # Fall back to the legacy trigger file for old dashboards
+                    requested = check_for_screenshot_request()
+            else:
+                requested = check_for_screenshot_request()
+                if _stop.wait(5):
+                    break
+
             # Check if driver exists and is responsive before taking screenshot
-            if check_for_screenshot_request() and driver:
+            if requested and driver:
                 try:
                     # Quick check if driver is still alive
                     driver.current_url
@@ -664,11 +1035,9 @@ def screenshot_monitor():
                     take_screenshot(driver, "manual_request")
                 except Exception as e:
                     logger.warning(f"Cannot take screenshot, driver not responsive: {e}")
-
-            time.sleep(5)  # Check every 5 seconds
         except Exception as e:
             logger.error(f"Error in screenshot monitor: {e}")
-            time.sleep(5)
+            _stop.wait(5)
 
     logger.info("Screenshot monitor stopped")
 
@@ -677,17 +1046,17 @@ def meeting_screenshot_monitor():
     global running, driver, current_meeting_active
     logger.info("Meeting screenshot monitor started - screenshots every 15 minutes during meetings")
 
-    while running:
+    while running and not _stop.is_set():
         try:
             if current_meeting_active and driver:
                 # Take a screenshot every 15 minutes (900 seconds)
                 wait_time = 900  # 15 minutes
                 
-                # Count down in smaller increments so we can check status more frequently
-                for i in range(wait_time):
-                    if not running or not current_meeting_active:
+                # Wait in 5s slices: the stop event interrupts instantly
+                # and the meeting-active flag is still rechecked often
+                for _ in range(wait_time // 5):
+                    if _stop.wait(5) or not running or not current_meeting_active:
                         break
-                    time.sleep(1)
                 
                 # Only take screenshot if meeting is still active after waiting
                 if current_meeting_active and driver and running:
@@ -699,11 +1068,12 @@ def meeting_screenshot_monitor():
                     except Exception as e:
                         logger.warning(f"Cannot take meeting screenshot, driver not responsive: {e}")
             else:
-                time.sleep(10)  # Check every 10 seconds when no meeting is active
-                
+                if _stop.wait(10):  # Check every 10 seconds when no meeting is active
+                    break
+
         except Exception as e:
             logger.error(f"Error in meeting screenshot monitor: {e}")
-            time.sleep(10)
+            _stop.wait(10)
 
     logger.info("Meeting screenshot monitor stopped")
 
@@ -737,7 +1107,7 @@ def main():
             break
         logger.error(f"Driver initialization attempt {attempt + 1}/{max_retries} failed")
         if attempt < max_retries - 1:
-            time.sleep(10)
+            _stop.wait(backoff(attempt, base=5, cap=60))
 
     if not driver:
         logger.error("Failed to initialize driver after all attempts. Exiting.")
@@ -763,6 +1133,13 @@ def main():
         max_consecutive_errors = 5
         ssl_error_count = 0
         max_ssl_errors = 3
+        auth_failures = 0
+        fetch_failures = 0
+        network_errors = 0
+        # Bound to a local so the loop body does one dict lookup per
+        # iteration at most; config itself is parsed once at import, so
+        # changing config.json requires a restart either way
+        refresh_time = config["refresh_time"]
 
         while running:
             try:
@@ -781,13 +1158,15 @@ def main():
                     update_app_status("Token expired - Re-authenticating")
                     json_token = login(USERNAME, PASSWORD)
                     if not json_token:
+                        auth_failures += 1
                         logger.error("Re-authentication failed")
                         update_app_status("Re-authentication failed")
-                        time.sleep(60)
+                        _stop.wait(backoff(auth_failures, base=10, cap=120))
                         continue
                     else:
                         consecutive_errors = 0
                         ssl_error_count = 0
+                        auth_failures = 0
                         continue
 
                 # Handle SSL errors
@@ -798,20 +1177,30 @@ def main():
                     
                     if ssl_error_count >= max_ssl_errors:
                         logger.info("Too many SSL errors. Performing full re-authentication...")
-                        time.sleep(30)  # Wait before retrying
-                    
+                        _stop.wait(backoff(ssl_error_count, base=15, cap=300))
+
+                    _reset_session()
+
                     # Try to re-authenticate
                     json_token = login(USERNAME, PASSWORD)
                     if not json_token:
+                        auth_failures += 1
                         logger.error("Re-authentication after SSL error failed")
-                        time.sleep(60)
+                        _stop.wait(backoff(auth_failures, base=10, cap=120))
                         continue
                     else:
                         logger.info("Re-authentication after SSL error successful")
                         ssl_error_count = 0  # Reset SSL error count on successful login
                         consecutive_errors = 0
+                        auth_failures = 0
                         continue
 
+                # Drop day-old entries so re-scheduled meetings can be
+                # rejoined and the dict cannot grow without bound
+                cutoff = time.monotonic() - ACTIVE_SESSION_TTL
+                for stale in [k for k, joined in active_sessions.items() if joined <= cutoff]:
+                    del active_sessions[stale]
+
                 if mid and title and mid not in active_sessions:
                     logger.info(f"Live meeting found: {title}")
                     consecutive_errors = 0  # Reset error counter
@@ -822,52 +1211,71 @@ def main():
                         meeting_info["status"] = "found"
                         update_app_status("Meeting found - Fetching details", meeting_info)
 
-                    meeting_data = fetch_meeting(json_token, mid)
-                    if not meeting_data:
-                        logger.error("Failed to fetch meeting data")
+                    # One failure path for the three pipeline stages: a
+                    # miss at any stage lands in the same handler with one
+                    # status write and one jittered backoff, instead of
+                    # stacking fixed 30s sleeps per stage
+                    try:
+                        meeting_data = fetch_meeting(json_token, mid)
+                        if not meeting_data:
+                            raise FetchError("fetch", "Failed to fetch meeting details")
+
+                        logger.info("Getting session URL...")
+                        sess_url = get_session_url(meeting_data)
+                        if not sess_url:
+                            raise FetchError("url", "Failed to extract session URL")
+
+                        sess_token_url = get_session_token(sess_url)
+                        if not sess_token_url:
+                            raise FetchError("token", "Failed to get session token")
+                    except FetchError as e:
+                        stage, message = e.args
+                        fetch_failures += 1
+                        logger.error(message)
                         if meeting_info:
-                            meeting_info["status"] = "fetch_failed"
-                            update_app_status("Failed to fetch meeting details", meeting_info)
-                        time.sleep(30)
+                            meeting_info["status"] = f"{stage}_failed"
+                            update_app_status(message, meeting_info)
+                        _stop.wait(backoff(fetch_failures, base=10, cap=120))
                         continue
 
-                    logger.info("Getting session URL...")
-                    sess_url = get_session_url(meeting_data)
-                    if not sess_url:
-                        logger.error("Failed to extract session URL")
-                        if meeting_info:
-                            meeting_info["status"] = "url_failed"
-                            update_app_status("Failed to extract session URL", meeting_info)
-                        time.sleep(30)
-                        continue
+                    fetch_failures = 0
 
-                    sess_token_url = get_session_token(sess_url)
-                    if not sess_token_url:
-                        logger.error("Failed to get session token URL")
-                        if meeting_info:
-                            meeting_info["status"] = "token_failed"
-                            update_app_status("Failed to get session token", meeting_info)
-                        time.sleep(30)
-                        continue
-                    
-                    take_screenshot(driver, "connecting_to_class")
+                    # Screenshot runs in parallel with the click sequence;
+                    # resolved before the next capture so they never overlap
+                    screenshot_fut = _EXEC.submit(take_screenshot, driver, "connecting_to_class")
                     logger.info("Connecting to the class...")
-                    
-                    if connect2class(driver, sess_token_url, meeting_info or {"title": title, "id": mid}):
-                        active_sessions.append(mid)
+
+                    connected = connect2class(driver, sess_token_url, meeting_info or {"title": title, "id": mid})
+                    try:
+                        screenshot_fut.result(timeout=10)
+                    except Exception as e:
+                        logger.warning(f"Connecting screenshot failed: {e}")
+
+                    if connected:
+                        active_sessions[mid] = time.monotonic()
                         logger.info("Connected successfully!")
                         take_screenshot(driver, "connected_successfully")
                         logger.info("Maintaining connection...")
                         
-                        # Stay connected for 5 minutes with periodic status updates
-                        connection_time = 300  # 5 minutes
-                        start_time = time.time()
-                        
-                        while time.time() - start_time < connection_time and running:
-                            time.sleep(30)  # Check every 30 seconds
-                            # Update status to show connection time remaining
-                            remaining = int(connection_time - (time.time() - start_time))
-                            if current_meeting_info:
+                        # Stay connected for 5 minutes. Waiting on the stop
+                        # event in short slices means SIGTERM interrupts the
+                        # hold within seconds instead of sleeping through it,
+                        # and a dead browser session ends the wait early
+                        # monotonic is immune to wall-clock jumps that
+                        # could stretch or cut the hold short
+                        deadline = time.monotonic() + 300  # 5 minutes
+                        tick = 0
+
+                        while time.monotonic() < deadline and running:
+                            if _stop.wait(5):
+                                break
+                            if not _session_alive(driver):
+                                logger.warning("Browser session no longer responsive, ending connection hold")
+                                break
+                            tick += 1
+                            if tick % 6 == 0 and current_meeting_info:
+                                # Update status to show connection time remaining
+                                remaining = int(deadline - time.monotonic())
                                 current_meeting_info["connection_remaining"] = remaining
                                 update_app_status("Connected to meeting", current_meeting_info)
                         
@@ -882,17 +1290,58 @@ def main():
                         update_app_status("Failed to connect to meeting")
                 else:
                     if consecutive_errors == 0 and ssl_error_count == 0:  # Only log this message after successful operations
-                        logger.info(f"No new live meetings. Next check in {config['refresh_time']}s")
+                        logger.info(f"No new live meetings. Next check in {refresh_time}s")
                         update_app_status("Waiting for meetings - No active meetings found")
 
-                time.sleep(config["refresh_time"])
+                refresh_time = config["refresh_time"]
+                # Sample fast around a scheduled start so the join fires
+                # within seconds of the class opening; idle polling keeps
+                # the configured rate - classes do start off-schedule here,
+                # so slowing the idle side would risk missing them
+                next_start = fetch_meetings._next_start
+                if next_start and abs(time.time() - next_start) < 120:
+                    interval = min(refresh_time, 15)
+                else:
+                    interval = refresh_time
+                network_errors = 0
+                if _stop.wait(interval):
+                    break
 
             except KeyboardInterrupt:
                 logger.info("Received keyboard interrupt")
                 break
+            except requests.exceptions.SSLError as e:
+                # Typed dispatch: network trouble is handled on its own
+                # counters and never feeds the driver-restart threshold
+                ssl_error_count += 1
+                logger.warning(f"SSL error in main loop ({ssl_error_count}/{max_ssl_errors}): {e}")
+                update_app_status(f"SSL error ({ssl_error_count}/{max_ssl_errors})")
+                _reset_session()
+                _stop.wait(backoff(ssl_error_count, base=15, cap=300))
+            except requests.exceptions.RequestException as e:
+                network_errors += 1
+                logger.warning(f"Network error in main loop (#{network_errors}): {e}")
+                update_app_status("Network error - retrying")
+                _stop.wait(backoff(network_errors, base=10, cap=120))
+            except WebDriverException as e:
+                # A sick browser will not recover on its own - restart the
+                # driver now instead of waiting out five generic errors
+                consecutive_errors += 1
+                logger.error(f"WebDriver error in main loop (#{consecutive_errors}): {e}")
+                update_app_status("Browser error - restarting driver")
+                cleanup_driver(driver)
+                current_meeting_active = False
+                current_meeting_info = {}
+                _stop.wait(backoff(consecutive_errors, base=10, cap=120))
+                driver = setup_headless_driver()
+                if not driver:
+                    logger.error("Failed to restart driver. Exiting.")
+                    update_app_status("Failed to restart driver")
+                    break
+                consecutive_errors = 0
             except Exception as e:
                 consecutive_errors += 1
-                logger.error(f"Error in main loop (#{consecutive_errors}): {e}")
+                logger.exception(f"Error in main loop (#{consecutive_errors})")
                 update_app_status(f"Error in main loop: {str(e)[:50]}")
 
                 if consecutive_errors >= max_consecutive_errors:
@@ -901,7 +1350,8 @@ def main():
                     current_meeting_active = False
                     current_meeting_info = {}
                     update_app_status("Restarting driver due to errors")
-                    time.sleep(30)
+                    if _stop.wait(30):
+                        break
                     driver = setup_headless_driver()
                     if not driver:
                         logger.error("Failed to restart driver. Exiting.")
@@ -909,7 +1359,7 @@ def main():
                         break
                     consecutive_errors = 0
                 else:
-                    time.sleep(min(30 * consecutive_errors, 300))  # Exponential backoff, max 5 minutes
+                    _stop.wait(backoff(consecutive_errors, base=15, cap=300))
 
     except Exception as e:
         logger.error(f"Fatal error in main function: {e}")
@@ -917,8 +1367,15 @@ def main():
     finally:
         current_meeting_active = False
         current_meeting_info = {}
+        # Stop the monitor threads before tearing down the driver so they
+        # do not keep running against a dying session; they are daemons, so
+        # a thread stuck in a long wait cannot block exit past the timeout
+        _stop.set()
+        for monitor in (screenshot_thread, meeting_screenshot_thread, cleanup_thread):
+            if monitor and monitor.is_alive():
+                monitor.join(timeout=5)
         cleanup_driver(driver)
-        update_app_status("Application shutdown")
+        update_app_status("Application shutdown", flush=True)
         logger.info("Application shutdown complete")
 
 if __name__ == '__main__':